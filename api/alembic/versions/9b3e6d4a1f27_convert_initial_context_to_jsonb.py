@@ -0,0 +1,43 @@
+"""convert workflow_runs.initial_context to jsonb
+
+Revision ID: 9b3e6d4a1f27
+Revises: c7a1e4f93b26
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "9b3e6d4a1f27"
+down_revision: Union[str, None] = "c7a1e4f93b26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Parse once at write time instead of casting JSON -> JSONB on every
+    # filtered read of the runs list.
+    op.alter_column(
+        "workflow_runs",
+        "initial_context",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="initial_context::jsonb",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "workflow_runs",
+        "initial_context",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using="initial_context::json",
+    )
@@ -0,0 +1,50 @@
+"""normalize knowledge_base_chunks embeddings and index by inner product
+
+Revision ID: c71e4b2d8a53
+Revises: 3f8c2a6d9e41
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c71e4b2d8a53"
+down_revision: Union[str, None] = "3f8c2a6d9e41"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Similarity search ranks by inner product, which only matches cosine for
+    # unit-length vectors. The application normalizes new embeddings; bring
+    # existing rows in line before the index is rebuilt over them.
+    op.drop_index(
+        "ix_kb_chunks_embedding_halfvec_ivfflat",
+        table_name="knowledge_base_chunks",
+    )
+    op.execute(
+        "UPDATE knowledge_base_chunks SET embedding = l2_normalize(embedding) "
+        "WHERE embedding IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX ix_kb_chunks_embedding_halfvec_ip_ivfflat "
+        "ON knowledge_base_chunks USING ivfflat "
+        "((embedding::halfvec(1536)) halfvec_ip_ops) WITH (lists = 100)"
+    )
+
+
+def downgrade() -> None:
+    # Normalized embeddings remain valid for cosine search; only the index
+    # operator class is restored.
+    op.drop_index(
+        "ix_kb_chunks_embedding_halfvec_ip_ivfflat",
+        table_name="knowledge_base_chunks",
+    )
+    op.execute(
+        "CREATE INDEX ix_kb_chunks_embedding_halfvec_ivfflat "
+        "ON knowledge_base_chunks USING ivfflat "
+        "((embedding::halfvec(1536)) halfvec_cosine_ops) WITH (lists = 100)"
+    )
@@ -36,10 +36,12 @@ from api.constants import REDIS_URL
 from api.errors.mps import MPS_UNAVAILABLE_PUBLIC_MESSAGE, MPSUnavailableError
 from api.mcp_server import mcp
 from api.routes.main import router as main_router
+from api.services.campaign.sources.csv import close_http_client
 from api.services.pipecat.tracing_config import (
     handle_langfuse_sync,
     load_all_org_langfuse_credentials,
 )
+from api.services.telephony.http_session import close_http_session
 from api.services.worker_sync.manager import (
     WorkerSyncManager,
     set_worker_sync_manager,
@@ -82,6 +84,8 @@ async def lifespan(app: FastAPI):
         logger.info("Starting graceful shutdown...")
         await sync_manager.stop()
         await loop_lag.stop()
+        await close_http_session()
+        await close_http_client()
 
 
 app = FastAPI(
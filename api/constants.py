@@ -120,6 +120,7 @@ POSTHOG_HOST = os.getenv("POSTHOG_HOST", "https://us.i.posthog.com")
 
 ENABLE_ARI_STASIS = os.getenv("ENABLE_ARI_STASIS", "false").lower() == "true"
 SERIALIZE_LOG_OUTPUT = os.getenv("SERIALIZE_LOG_OUTPUT", "false").lower() == "true"
+ENABLE_TURN_LOGGING = os.getenv("ENABLE_TURN_LOGGING", "false").lower() == "true"
 
 # Telephony media WebSocket authentication.
 # The carrier/connector dials back the media socket
@@ -253,6 +254,11 @@ TURN_CREDENTIAL_TTL = int(os.getenv("TURN_CREDENTIAL_TTL", "86400"))
 # verifying TURN connectivity end-to-end; expect connection failures if
 # TURN is misconfigured or unreachable.
 FORCE_TURN_RELAY = os.getenv("FORCE_TURN_RELAY", "false").lower() == "true"
+# Per-process cap on concurrently running WebRTC pipelines. Offers past it are
+# rejected so a reconnect storm can't starve the calls already in progress.
+MAX_CONCURRENT_WEBRTC_PIPELINES = max(
+    1, int(os.getenv("MAX_CONCURRENT_WEBRTC_PIPELINES", "200"))
+)
 
 # OSS Email/Password Auth
 OSS_JWT_SECRET = os.getenv("OSS_JWT_SECRET", "change-me-in-production")
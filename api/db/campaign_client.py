@@ -517,12 +517,41 @@ class CampaignClient(BaseDBClient):
                 raise
 
     # QueuedRun methods
-    async def bulk_create_queued_runs(self, queued_runs_data: list[dict]) -> None:
-        """Bulk create queued runs"""
+    async def bulk_create_queued_runs(
+        self, campaign_id: int, queued_runs: list[tuple[str, dict]]
+    ) -> None:
+        """Bulk create queued runs from ``(source_uuid, context_variables)`` pairs.
+
+        Rows are streamed with Postgres ``COPY`` over the asyncpg connection,
+        so column names are sent once rather than bound per row. A single
+        ``COPY`` is atomic: a failed sync leaves no partial set of runs behind.
+        """
+        created_at = datetime.now(UTC)
+        records = (
+            (
+                campaign_id,
+                source_uuid,
+                json.dumps(context_variables),
+                "queued",
+                created_at,
+            )
+            for source_uuid, context_variables in queued_runs
+        )
         async with self.async_session() as session:
-            queued_runs = [QueuedRunModel(**data) for data in queued_runs_data]
-            session.add_all(queued_runs)
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
             try:
+                await raw_connection.driver_connection.copy_records_to_table(
+                    QueuedRunModel.__tablename__,
+                    records=records,
+                    columns=[
+                        "campaign_id",
+                        "source_uuid",
+                        "context_variables",
+                        "state",
+                        "created_at",
+                    ],
+                )
                 await session.commit()
             except Exception as e:
                 await session.rollback()
@@ -185,9 +185,7 @@ def apply_workflow_run_filters(
                     # not the JSONB @> operator (the default for untyped exprs).
                     filter_conditions.append(
                         cast(
-                            cast(WorkflowRunModel.initial_context, JSONB).op("->>")(
-                                "caller_number"
-                            ),
+                            WorkflowRunModel.initial_context.op("->>")("caller_number"),
                             Text,
                         ).contains(phone)
                     )
@@ -197,9 +195,7 @@ def apply_workflow_run_filters(
                 if phone:
                     filter_conditions.append(
                         cast(
-                            cast(WorkflowRunModel.initial_context, JSONB).op("->>")(
-                                "called_number"
-                            ),
+                            WorkflowRunModel.initial_context.op("->>")("called_number"),
                             Text,
                         ).contains(phone)
                     )
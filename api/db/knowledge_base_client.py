@@ -1,6 +1,7 @@
 """Database client for managing knowledge base documents and chunks."""
 
 import hashlib
+import math
 from pathlib import Path
 from typing import List, Optional
 
@@ -11,6 +12,28 @@ from sqlalchemy.orm import selectinload
 from api.db.base_client import BaseDBClient
 from api.db.models import KnowledgeBaseChunkModel, KnowledgeBaseDocumentModel
 
+# Similarity search pulls this many times ``limit`` candidates from the
+# halfvec index before re-ranking them at full precision.
+_RERANK_CANDIDATE_FACTOR = 4
+# IVFFlat lists scanned per query. pgvector's default of 1 searches only one
+# of the index's 100 lists, which misses close matches and, combined with the
+# organization filter, can return fewer rows than requested. sqrt(lists) is
+# pgvector's recommended starting point.
+_IVFFLAT_PROBES = 10
+
+
+def _unit_vector(vector: List[float]) -> List[float]:
+    """Scale an embedding to unit length; zero vectors are returned as-is.
+
+    Stored and query embeddings are both normalized so similarity search can
+    rank by inner product, which for unit vectors equals cosine similarity
+    without the per-comparison norms.
+    """
+    norm = math.hypot(*vector)
+    if not norm:
+        return list(vector)
+    return [component / norm for component in vector]
+
 
 class KnowledgeBaseClient(BaseDBClient):
     """Client for managing knowledge base documents and vector embeddings."""
@@ -291,6 +314,9 @@ class KnowledgeBaseClient(BaseDBClient):
             List of created chunks with IDs
         """
         async with self.async_session() as session:
+            for chunk in chunks:
+                if chunk.embedding is not None:
+                    chunk.embedding = _unit_vector(chunk.embedding)
             session.add_all(chunks)
             await session.commit()
 
@@ -305,8 +331,14 @@ class KnowledgeBaseClient(BaseDBClient):
         document_id: int,
         organization_id: int,
         chunks: List[KnowledgeBaseChunkModel],
-    ) -> List[KnowledgeBaseChunkModel]:
-        """Replace all chunks for a document with a new precomputed batch."""
+    ) -> None:
+        """Replace all chunks for a document with a new precomputed batch.
+
+        Embeddings are normalized to unit length before they are stored (see
+        ``search_similar_chunks``). The chunks are not refreshed after the
+        commit: that would cost one SELECT per chunk, each reading its
+        embedding back, and ingestion does not use the stored rows.
+        """
         async with self.async_session() as session:
             await session.execute(
                 delete(KnowledgeBaseChunkModel).where(
@@ -314,16 +346,15 @@ class KnowledgeBaseClient(BaseDBClient):
                     KnowledgeBaseChunkModel.organization_id == organization_id,
                 )
             )
+            for chunk in chunks:
+                if chunk.embedding is not None:
+                    chunk.embedding = _unit_vector(chunk.embedding)
             session.add_all(chunks)
             await session.commit()
 
-            for chunk in chunks:
-                await session.refresh(chunk)
-
             logger.info(
                 f"Replaced chunks for document {document_id}: {len(chunks)} chunks"
             )
-            return chunks
 
     async def get_chunks_for_document(
         self,
@@ -421,33 +452,61 @@ class KnowledgeBaseClient(BaseDBClient):
 
             # Build the complete SQL query
             where_clause = " AND ".join(where_conditions)
+            # Two stages: the halfvec index picks a candidate pool a few times
+            # larger than the limit, then the candidates are re-ranked on the
+            # full-precision embeddings so quantization can't reorder results.
+            # Embeddings are unit length, so the negated inner product (<#>)
+            # ranks exactly like cosine distance and is the cosine similarity.
             query_sql = f"""
+                WITH candidates AS (
+                    SELECT
+                        c.id,
+                        c.document_id,
+                        c.chunk_text,
+                        c.contextualized_text,
+                        c.chunk_metadata,
+                        c.chunk_index,
+                        c.embedding,
+                        d.filename,
+                        d.document_uuid
+                    FROM knowledge_base_chunks c
+                    JOIN knowledge_base_documents d ON c.document_id = d.id
+                    WHERE {where_clause}
+                    ORDER BY c.embedding::halfvec(1536) <#> $1::vector::halfvec(1536)
+                    LIMIT $3 * {_RERANK_CANDIDATE_FACTOR}
+                )
                 SELECT
-                    c.id,
-                    c.document_id,
-                    c.chunk_text,
-                    c.contextualized_text,
-                    c.chunk_metadata,
-                    c.chunk_index,
-                    d.filename,
-                    d.document_uuid,
-                    1 - (c.embedding <=> $1::vector) as similarity
-                FROM knowledge_base_chunks c
-                JOIN knowledge_base_documents d ON c.document_id = d.id
-                WHERE {where_clause}
-                ORDER BY c.embedding <=> $1::vector
+                    id,
+                    document_id,
+                    chunk_text,
+                    contextualized_text,
+                    chunk_metadata,
+                    chunk_index,
+                    filename,
+                    document_uuid,
+                    -(embedding <#> $1::vector) as similarity
+                FROM candidates
+                ORDER BY embedding <#> $1::vector
                 LIMIT $3
             """
 
             # Convert embedding to string format for PostgreSQL vector type
-            embedding_str = "[" + ",".join(map(str, query_embedding)) + "]"
+            embedding_str = (
+                "[" + ",".join(map(str, _unit_vector(query_embedding))) + "]"
+            )
             params[0] = embedding_str  # Set $1
 
-            # Execute query directly with asyncpg
-            rows = await raw_connection.driver_connection.fetch(
-                query_sql,
-                *params,
-            )
+            # Execute query directly with asyncpg. SET LOCAL only lasts for a
+            # transaction, so run both statements inside one.
+            driver_connection = raw_connection.driver_connection
+            async with driver_connection.transaction():
+                await driver_connection.execute(
+                    f"SET LOCAL ivfflat.probes = {_IVFFLAT_PROBES}"
+                )
+                rows = await driver_connection.fetch(
+                    query_sql,
+                    *params,
+                )
 
             # Convert asyncpg records to dictionaries
             return [dict(row) for row in rows]
@@ -547,11 +606,8 @@ class KnowledgeBaseClient(BaseDBClient):
         Returns:
             SHA-256 hash as hex string
         """
-        sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
     @staticmethod
     def get_mime_type(file_path: str) -> str:
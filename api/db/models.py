@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, Vector
 from sqlalchemy import (
     JSON,
     Boolean,
@@ -20,6 +20,7 @@ from sqlalchemy import (
     func,
     text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
 from api.constants import DEFAULT_CAMPAIGN_RETRY_CONFIG
@@ -562,7 +563,7 @@ class WorkflowRunModel(Base):
     )
     usage_info = Column(JSON, nullable=False, default=dict)
     cost_info = Column(JSON, nullable=False, default=dict)
-    initial_context = Column(JSON, nullable=False, default=dict)
+    initial_context = Column(JSONB, nullable=False, default=dict)
     gathered_context = Column(JSON, nullable=False, default=dict)
     logs = Column(JSON, nullable=False, default=dict, server_default=text("'{}'::json"))
     annotations = Column(JSON, nullable=False, default=dict)
@@ -1449,11 +1450,15 @@ class KnowledgeBaseChunkModel(Base):
         # Vector similarity search index (using IVFFlat or HNSW)
         # IVFFlat is good for datasets with 10k-1M vectors
         # HNSW is better for larger datasets but uses more memory
+        # Indexed as halfvec: half the index size for a negligible recall
+        # loss. The column keeps full precision for the similarity score.
+        # Embeddings are stored unit length, so inner product ranks like
+        # cosine at a third of the arithmetic.
         Index(
-            "ix_kb_chunks_embedding_ivfflat",
-            "embedding",
+            "ix_kb_chunks_embedding_halfvec_ip_ivfflat",
+            func.cast(embedding, HALFVEC(1536)).label("embedding"),
             postgresql_using="ivfflat",
             postgresql_with={"lists": 100},  # Adjust based on dataset size
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_ops={"embedding": "halfvec_ip_ops"},
         ),
     )
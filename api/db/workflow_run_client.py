@@ -1,7 +1,8 @@
+import json
 import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func
+from sqlalchemy import func, text
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload, selectinload
 
@@ -404,6 +405,40 @@ class WorkflowRunClient(BaseDBClient):
             await session.refresh(run)
         return run
 
+    async def append_workflow_run_log(
+        self, run_id: int, key: str, entry: Dict[str, Any]
+    ) -> None:
+        """Append ``entry`` to the ``logs[key]`` JSON array of a workflow run.
+
+        Uses a SQL-side jsonb concat so concurrent status callbacks do not
+        clobber each other's entries, and skips the row read entirely.
+        """
+        async with self.async_session() as session:
+            await session.execute(
+                text(
+                    "UPDATE workflow_runs "
+                    "SET logs = ("
+                    "        COALESCE(logs::jsonb, '{}'::jsonb) "
+                    "        || jsonb_build_object("
+                    "            CAST(:key AS text), "
+                    "            COALESCE(logs::jsonb -> :key, '[]'::jsonb) "
+                    "            || CAST(:entry AS jsonb)"
+                    "        )"
+                    "    )::json "
+                    "WHERE id = :run_id"
+                ),
+                {
+                    "key": key,
+                    "entry": json.dumps([entry]),
+                    "run_id": run_id,
+                },
+            )
+            try:
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
     async def get_workflow_run_with_context(
         self, workflow_run_id: int
     ) -> Tuple[Optional[WorkflowRunModel], Optional[int]]:
@@ -490,12 +525,14 @@ class WorkflowRunClient(BaseDBClient):
             return result.scalars().first()
 
     async def get_workflow_run_by_call_id(
-        self, call_id: str
+        self, call_id: str, workflow_id: int | None = None
     ) -> Optional[WorkflowRunModel]:
         """Find workflow run by call_id stored in gathered_context.
 
         Args:
             call_id: The telephony call ID to search for
+            workflow_id: When given, only match runs of this workflow so the
+                ownership check happens in the same round-trip
 
         Returns:
             The WorkflowRunModel if found, None otherwise
@@ -503,7 +540,7 @@ class WorkflowRunClient(BaseDBClient):
         async with self.async_session() as session:
             # Use JSON text extraction to find matching call_id
             # This leverages the idx_workflow_runs_call_id index
-            result = await session.execute(
+            query = (
                 select(WorkflowRunModel)
                 .options(
                     joinedload(WorkflowRunModel.workflow).joinedload(WorkflowModel.user)
@@ -511,7 +548,11 @@ class WorkflowRunClient(BaseDBClient):
                 .where(
                     WorkflowRunModel.gathered_context.op("->>")("call_id") == call_id
                 )
-                .order_by(WorkflowRunModel.created_at.desc())
-                .limit(1)
+            )
+            if workflow_id is not None:
+                query = query.where(WorkflowRunModel.workflow_id == workflow_id)
+
+            result = await session.execute(
+                query.order_by(WorkflowRunModel.created_at.desc()).limit(1)
             )
             return result.scalars().first()
@@ -65,6 +65,7 @@ _URL_USERINFO_RE = re.compile(r"(?i)(\b(?:https?|wss?)://)([^/@\s]+)@")
 _HTTP_STATUS_IN_MESSAGE_RE = re.compile(
     r"(?i)\b(?:http(?:\s+status)?|status(?:_code)?)\s*[:=]?\s*(\d{3})\b"
 )
+_NON_SLUG_CHARS_RE = re.compile(r"[^a-z0-9]+")
 _MAX_MESSAGE_LENGTH = 4000
 _FAILURE_METADATA_ATTR = "_dograh_failure_metadata"
 _FAILURE_REPORTED_ATTR = "_dograh_failure_reported"
@@ -102,12 +103,12 @@ def _enum_value(value: object) -> str:
 def _normalize_provider(provider: object | None) -> str | None:
     if provider is None:
         return None
-    normalized = re.sub(r"[^a-z0-9]+", "-", _enum_value(provider).strip().lower())
+    normalized = _NON_SLUG_CHARS_RE.sub("-", _enum_value(provider).strip().lower())
     return normalized.strip("-") or None
 
 
 def _normalize_code(code: str) -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "-", code.strip().lower()).strip("-")
+    normalized = _NON_SLUG_CHARS_RE.sub("-", code.strip().lower()).strip("-")
     return normalized or "platform-unknown"
 
 
@@ -234,7 +235,7 @@ def extract_provider_error_code(
         if raw_code.isdigit() and http_status == int(raw_code):
             continue
 
-        normalized = re.sub(r"[^a-z0-9]+", "-", raw_code.lower()).strip("-")
+        normalized = _NON_SLUG_CHARS_RE.sub("-", raw_code.lower()).strip("-")
         if normalized:
             return normalized
     return None
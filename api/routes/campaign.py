@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -16,7 +16,6 @@ from api.db.models import UserModel
 from api.enums import OrganizationConfigurationKey
 from api.services.auth.depends import get_user
 from api.services.campaign.runner import campaign_runner_service
-from api.services.campaign.source_sync import CampaignSourceSyncService
 from api.services.campaign.source_sync_factory import get_sync_service
 from api.services.quota_service import authorize_workflow_run_start
 from api.services.reports import generate_campaign_report_csv
@@ -358,48 +357,32 @@ async def create_campaign(
         raise HTTPException(status_code=404, detail="Workflow not found")
     workflow_name = workflow.name
 
-    # Validate source data (phone_number column and format)
+    # Template variables the workflow uses; the source must have a non-empty
+    # column for each of them
+    required_vars: Set[str] = set()
+    workflow_def = workflow.released_definition.workflow_json
+    if workflow_def:
+        from api.services.workflow.dto import ReactFlowDTO
+        from api.services.workflow.workflow_graph import WorkflowGraph
+
+        try:
+            dto = ReactFlowDTO(**workflow_def)
+            graph = WorkflowGraph(dto, skip_instance_constraints_for={"trigger"})
+            required_vars = graph.get_required_template_variables()
+        except Exception:
+            pass  # Don't block campaign creation if template extraction fails
+
+    # Validate source data (phone_number column and format, template
+    # variables) in a single pass over the rows
     sync_service = get_sync_service(request.source_type)
     validation_result = await sync_service.validate_source(
-        request.source_id, user.selected_organization_id
+        request.source_id,
+        user.selected_organization_id,
+        required_columns=required_vars,
     )
     if not validation_result.is_valid:
         raise HTTPException(status_code=400, detail=validation_result.error.message)
 
-    # Validate template variables against source data columns
-    if workflow:
-        from api.services.workflow.dto import ReactFlowDTO
-        from api.services.workflow.workflow_graph import WorkflowGraph
-
-        workflow_def = workflow.released_definition.workflow_json
-        if workflow_def:
-            try:
-                dto = ReactFlowDTO(**workflow_def)
-                graph = WorkflowGraph(dto, skip_instance_constraints_for={"trigger"})
-                required_vars = graph.get_required_template_variables()
-
-                if (
-                    required_vars
-                    and validation_result.headers
-                    and validation_result.rows
-                ):
-                    template_validation = (
-                        CampaignSourceSyncService.validate_template_columns(
-                            validation_result.headers,
-                            validation_result.rows,
-                            required_vars,
-                        )
-                    )
-                    if not template_validation.is_valid:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=template_validation.error.message,
-                        )
-            except HTTPException:
-                raise
-            except Exception:
-                pass  # Don't block campaign creation if template extraction fails
-
     if request.max_concurrency is not None:
         await _validate_max_concurrency(
             request.max_concurrency, user.selected_organization_id
@@ -3,9 +3,11 @@ Telephony routes - handles all telephony-related endpoints.
 Consolidated from split modules for easier maintenance.
 """
 
+import asyncio
+import importlib
 import json
 import uuid
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import (
     APIRouter,
@@ -31,10 +33,13 @@ from api.services.call_concurrency import (
     WorkflowRunSlotAlreadyBoundError,
     call_concurrency,
 )
+from api.services.organization_preferences import get_organization_preferences
 from api.services.quota_service import authorize_workflow_run_start
+from api.services.telephony import registry as telephony_registry
 from api.services.telephony import ws_auth
 from api.services.telephony.call_transfer_manager import get_call_transfer_manager
 from api.services.telephony.factory import (
+    find_telephony_config_for_inbound,
     get_all_telephony_providers,
     get_default_telephony_provider,
     get_telephony_provider_by_id,
@@ -49,6 +54,7 @@ from api.services.workflow_run_failure import mark_workflow_run_failed
 from api.utils.common import get_backend_endpoints
 from api.utils.telephony_helper import (
     generic_hangup_response,
+    is_outbound_webhook,
     normalize_webhook_data,
     numbers_match,
     parse_webhook_request,
@@ -91,8 +97,6 @@ async def initiate_call(
     """Initiate a call using the configured telephony provider from web browser. This is
     supposed to be a test call method for the draft version of the agent."""
 
-    from api.services.organization_preferences import get_organization_preferences
-
     preferences = await get_organization_preferences(
         user.selected_organization_id,
         db=db_client,
@@ -372,8 +376,6 @@ async def _validate_inbound_request(
     Validate all aspects of inbound request.
     Returns: (is_valid, error_type, workflow_context, provider_instance)
     """
-    from api.services.telephony import registry as telephony_registry
-
     # System lookup: inbound routing only has the workflow_id and derives the
     # org/user from the workflow itself, so use the explicit unscoped variant.
     workflow = await db_client.get_workflow_by_id(workflow_id)
@@ -523,8 +525,6 @@ async def _resolve_inbound_telephony_config(
     Returns ``(VALID, config_id)`` on success or ``(error, None)`` otherwise.
     Replaces the single-config check that assumed one provider per org.
     """
-    from api.services.telephony.factory import find_telephony_config_for_inbound
-
     try:
         candidates = await db_client.list_telephony_configurations_by_provider(
             organization_id, provider_class.PROVIDER_NAME
@@ -795,12 +795,14 @@ async def handle_inbound_run(request: Request):
     each provider's ``verify_inbound_signature`` reads its own headers from
     the dict, so adding a new provider doesn't require changes to this route.
     """
-    from api.services.telephony import registry as telephony_registry
-
     logger.info("Inbound /run dispatch received")
 
     try:
         webhook_data, raw_body = await parse_webhook_request(request)
+        if is_outbound_webhook(webhook_data):
+            logger.warning("Outbound call webhook received on /inbound/run")
+            return generic_hangup_response()
+
         headers = dict(request.headers)
 
         provider_class = await _detect_provider(webhook_data, headers)
@@ -915,10 +917,18 @@ async def handle_inbound_run(request: Request):
             )
             await call_concurrency.bind_workflow_run(concurrency_slot, workflow_run_id)
 
-            quota_result = await authorize_workflow_run_start(
-                workflow_id=workflow_id,
-                organization_id=config.organization_id,
-                workflow_run_id=workflow_run_id,
+            # Quota authorization and endpoint resolution are independent, so
+            # overlap them rather than paying for both sequentially.
+            (
+                quota_result,
+                (backend_endpoint, wss_backend_endpoint),
+            ) = await asyncio.gather(
+                authorize_workflow_run_start(
+                    workflow_id=workflow_id,
+                    organization_id=config.organization_id,
+                    workflow_run_id=workflow_run_id,
+                ),
+                get_backend_endpoints(),
             )
             if not quota_result.has_quota:
                 logger.warning(
@@ -932,7 +942,6 @@ async def handle_inbound_run(request: Request):
                     TelephonyError.QUOTA_EXCEEDED
                 )
 
-            backend_endpoint, wss_backend_endpoint = await get_backend_endpoints()
             websocket_url = ws_auth.build_media_ws_url(
                 wss_backend_endpoint,
                 workflow_id,
@@ -994,9 +1003,13 @@ async def handle_inbound_fallback(request: Request):
             "Our system is temporarily unavailable. Please try again later.",
         )
     else:
-        # Unknown provider - return generic XML
+        # Unknown provider - return generic XML. Log only the headers provider
+        # detection keys on rather than serializing the full header set.
         logger.info(
-            f"[fallback] Received unknown provider callback: {json.dumps(webhook_data)} and request headers: {json.dumps(headers)}"
+            "[fallback] Received unknown provider callback: "
+            f"{json.dumps(webhook_data)} "
+            f"content-type={headers.get('content-type')} "
+            f"user-agent={headers.get('user-agent')}"
         )
 
         return generic_hangup_response()
@@ -1022,7 +1035,11 @@ async def handle_inbound_telephony(
 
     try:
         webhook_data, raw_body = await parse_webhook_request(request)
-        logger.info(f"Inbound call data: {dict(webhook_data)}")
+        logger.info(f"Inbound call data: {webhook_data}")
+        if is_outbound_webhook(webhook_data):
+            logger.warning("Outbound call webhook received on inbound route")
+            return generic_hangup_response()
+
         headers = dict(request.headers)
 
         # Detect provider and normalize data
@@ -1089,10 +1106,16 @@ async def handle_inbound_telephony(
             )
             await call_concurrency.bind_workflow_run(concurrency_slot, workflow_run_id)
 
-            quota_result = await authorize_workflow_run_start(
-                workflow_id=workflow_id,
-                organization_id=organization_id,
-                workflow_run_id=workflow_run_id,
+            (
+                quota_result,
+                (backend_endpoint, wss_backend_endpoint),
+            ) = await asyncio.gather(
+                authorize_workflow_run_start(
+                    workflow_id=workflow_id,
+                    organization_id=organization_id,
+                    workflow_run_id=workflow_run_id,
+                ),
+                get_backend_endpoints(),
             )
             if not quota_result.has_quota:
                 logger.warning(
@@ -1108,7 +1131,6 @@ async def handle_inbound_telephony(
                 )
 
             # Generate response URLs
-            backend_endpoint, wss_backend_endpoint = await get_backend_endpoints()
             websocket_url = ws_auth.build_media_ws_url(
                 wss_backend_endpoint, workflow_id, organization_id, workflow_run_id
             )
@@ -1146,76 +1168,97 @@ async def handle_inbound_telephony(
         return generic_hangup_response()
 
 
+# Final Twilio transfer-leg statuses that fail the transfer, with the
+# user-facing result each one reports.
+_TRANSFER_FAILURE_RESULTS: dict[str, dict[str, str]] = {
+    "no-answer": {
+        "status": "transfer_failed",
+        "reason": "no_answer",
+        "message": "The transfer call was not answered. The person may be busy or unavailable right now.",
+        "action": "transfer_failed",
+    },
+    "busy": {
+        "status": "transfer_failed",
+        "reason": "busy",
+        "message": "The transfer call encountered a busy signal. The person is likely on another call.",
+        "action": "transfer_failed",
+    },
+    "failed": {
+        "status": "transfer_failed",
+        "reason": "call_failed",
+        "message": "The transfer call failed to connect. There may be a network issue or the number is unavailable.",
+        "action": "transfer_failed",
+    },
+}
+
+
 @router.post("/transfer-result/{transfer_id}")
-async def complete_transfer_function_call(transfer_id: str, request: Request):
+async def complete_transfer_function_call(
+    transfer_id: str, request: Request
+) -> dict[str, Any]:
     """Webhook endpoint to complete the function call with transfer result.
 
     Called by Twilio's StatusCallback when the transfer call status changes.
+    The transfer event is published before replying, so a failed publish can
+    still be retried by Twilio.
     """
     form_data = await request.form()
-    data = dict(form_data)
-
-    call_status = data.get("CallStatus", "")
-    call_sid = data.get("CallSid", "")
+    call_status = form_data.get("CallStatus", "")
+    call_sid = form_data.get("CallSid", "")
 
     logger.info(
         f"Transfer result(call status) webhook: {transfer_id} status={call_status}"
     )
 
-    # Get transfer context from Redis for additional information
-    call_transfer_manager = await get_call_transfer_manager()
-    transfer_context = await call_transfer_manager.get_transfer_context(transfer_id)
-
-    original_call_sid = transfer_context.original_call_sid if transfer_context else None
-    conference_name = transfer_context.conference_name if transfer_context else None
-
     # Determine the result based on call status with user-friendly messaging
     if call_status in ("in-progress", "answered"):
         result = {
             "status": "success",
             "message": "Great! The destination number answered. Let me transfer you now.",
             "action": "destination_answered",
-            "conference_id": conference_name,
             "transfer_call_sid": call_sid,  # The outbound transfer call SID
-            "original_call_sid": original_call_sid,  # The original caller's SID
             "end_call": False,  # Continue with transfer
         }
-    elif call_status == "no-answer":
-        result = {
-            "status": "transfer_failed",
-            "reason": "no_answer",
-            "message": "The transfer call was not answered. The person may be busy or unavailable right now.",
-            "action": "transfer_failed",
-            "call_sid": call_sid,
-            "end_call": True,
-        }
-    elif call_status == "busy":
-        result = {
-            "status": "transfer_failed",
-            "reason": "busy",
-            "message": "The transfer call encountered a busy signal. The person is likely on another call.",
-            "action": "transfer_failed",
-            "call_sid": call_sid,
-            "end_call": True,
-        }
-    elif call_status == "failed":
+    elif call_status in _TRANSFER_FAILURE_RESULTS:
         result = {
-            "status": "transfer_failed",
-            "reason": "call_failed",
-            "message": "The transfer call failed to connect. There may be a network issue or the number is unavailable.",
-            "action": "transfer_failed",
+            **_TRANSFER_FAILURE_RESULTS[call_status],
             "call_sid": call_sid,
             "end_call": True,
         }
     else:
-        # Intermediate status (ringing, in-progress, etc.), don't complete yet
+        # Intermediate status (queued, initiated, ringing), don't complete yet
         logger.info(
             f"Received intermediate status {call_status}, waiting for final status"
         )
         return {"status": "pending"}
 
-    # Complete the function call with Redis event publishing
+    # Twilio retries StatusCallbacks on timeouts/5xx; publish each final
+    # status at most once so the pipeline doesn't react to it twice.
+    call_transfer_manager = await get_call_transfer_manager()
+    step = f"result:{call_sid}:{call_status}"
+    if not await call_transfer_manager.claim_transfer_step(transfer_id, step, ttl=600):
+        logger.info(
+            f"Duplicate transfer result webhook for {transfer_id} "
+            f"status={call_status}, skipping publish"
+        )
+        previous_result = await call_transfer_manager.get_transfer_step_result(
+            transfer_id, step
+        )
+        return {"status": "completed", "result": previous_result or result}
+
     try:
+        # Get transfer context from Redis for additional information. Only
+        # final statuses need it, so intermediate callbacks skip the round-trip.
+        transfer_context = await call_transfer_manager.get_transfer_context(transfer_id)
+
+        original_call_sid = (
+            transfer_context.original_call_sid if transfer_context else None
+        )
+        conference_name = transfer_context.conference_name if transfer_context else None
+        if result["status"] == "success":
+            result["conference_id"] = conference_name
+            result["original_call_sid"] = original_call_sid  # The original caller's SID
+
         # Determine event type based on result status
         if result["status"] == "success":
             event_type = TransferEventType.DESTINATION_ANSWERED
@@ -1234,15 +1277,24 @@ async def complete_transfer_function_call(transfer_id: str, request: Request):
             reason=result.get("reason"),
         )
 
-        # Publish the event via Redis
-        await call_transfer_manager.publish_transfer_event(transfer_event)
+        # Publish via Redis; publish_transfer_event logs its own failures.
+        if not await call_transfer_manager.publish_transfer_event(transfer_event):
+            raise HTTPException(
+                status_code=503, detail="Failed to publish transfer event"
+            )
         logger.info(
             f"Published {event_type} event for {transfer_id} with result: {result['status']}"
         )
-
     except Exception as e:
+        # Let Twilio's retry handle this status instead of being answered as
+        # a duplicate of a delivery that never published anything.
         logger.error(f"Error completing transfer {transfer_id}: {e}")
+        await call_transfer_manager.release_transfer_step(transfer_id, step)
+        raise
 
+    await call_transfer_manager.record_transfer_step_result(
+        transfer_id, step, result, ttl=600
+    )
     return {"status": "completed", "result": result}
 
 
@@ -1256,11 +1308,7 @@ async def complete_transfer_function_call(transfer_id: str, request: Request):
 # being wired up, not when someone merely asks for a TelephonyProvider
 # class. This is what keeps the package init free of cycles.
 def _mount_provider_routers() -> None:
-    import importlib
-
-    from api.services.telephony import registry as _telephony_registry
-
-    for spec in _telephony_registry.all_specs():
+    for spec in telephony_registry.all_specs():
         try:
             module = importlib.import_module(
                 f"api.services.telephony.providers.{spec.name}.routes"
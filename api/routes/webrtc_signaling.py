@@ -29,7 +29,13 @@ from pipecat.transports.smallwebrtc.connection import SmallWebRTCConnection
 from pipecat.utils.run_context import set_current_org_id, set_current_run_id
 from starlette.websockets import WebSocketState
 
-from api.constants import ENABLE_COTURN, ENVIRONMENT, FORCE_TURN_RELAY, SERVER_IP
+from api.constants import (
+    ENABLE_COTURN,
+    ENVIRONMENT,
+    FORCE_TURN_RELAY,
+    MAX_CONCURRENT_WEBRTC_PIPELINES,
+    SERVER_IP,
+)
 from api.db import db_client
 from api.db.models import UserModel
 from api.enums import Environment, WorkflowRunMode
@@ -238,9 +244,7 @@ def get_ice_servers(user_id: Optional[str] = None) -> List[RTCIceServer]:
     # relay-only connection — it only gathers a public IP that
     # filter_outbound_sdp() strips back out. Matches the client-side skip.
     servers: List[RTCIceServer] = (
-        []
-        if FORCE_TURN_RELAY
-        else [RTCIceServer(urls="stun:stun.l.google.com:19302")]
+        [] if FORCE_TURN_RELAY else [RTCIceServer(urls="stun:stun.l.google.com:19302")]
     )
 
     # Check if TURN is configured. ENABLE_COTURN is the deployment's declared
@@ -308,6 +312,9 @@ class SignalingManager:
         self._peer_connections: Dict[str, SmallWebRTCConnection] = {}
         self._connection_peer_ids: Dict[str, Set[str]] = {}
         self._peer_connection_owners: Dict[str, str] = {}
+        # Running pipeline tasks; holds strong references and bounds how many
+        # pipelines this process runs at once.
+        self._pipeline_tasks: Set[asyncio.Task] = set()
 
     def _track_peer_connection(
         self, connection_id: str, pc_id: str, pc: SmallWebRTCConnection
@@ -427,17 +434,29 @@ class SignalingManager:
             # we maintain our own connection map instead of relying on
             # SmallWebRTCRequestHandler's _pcs_map. This is suitable for
             # multi-worker FastAPI deployments where state cannot be shared.
+            owned_pcs = []
             for pc_id in peer_ids:
                 self._peer_connection_owners.pop(pc_id, None)
                 pc = self._peer_connections.pop(pc_id, None)
                 if pc:
-                    try:
-                        await pc.disconnect()
-                        logger.debug(f"Disconnected peer connection: {pc_id}")
-                    except Exception as e:
-                        logger.debug(
-                            f"Failed to disconnect peer connection {pc_id}: {e}"
-                        )
+                    owned_pcs.append((pc_id, pc))
+
+            # Tear them down concurrently rather than one after another.
+            await asyncio.gather(
+                *(
+                    self._disconnect_peer_connection(pc_id, pc)
+                    for pc_id, pc in owned_pcs
+                )
+            )
+
+    async def _disconnect_peer_connection(
+        self, pc_id: str, pc: SmallWebRTCConnection
+    ) -> None:
+        try:
+            await pc.disconnect()
+            logger.debug(f"Disconnected peer connection: {pc_id}")
+        except Exception as e:
+            logger.debug(f"Failed to disconnect peer connection {pc_id}: {e}")
 
     async def _handle_message(
         self,
@@ -504,6 +523,30 @@ class SignalingManager:
             )
             return
 
+        # Shed new calls once this process is at capacity; renegotiating an
+        # existing connection is always allowed.
+        if (
+            pc_id not in self._peer_connections
+            and len(self._pipeline_tasks) >= MAX_CONCURRENT_WEBRTC_PIPELINES
+        ):
+            logger.warning(
+                f"Rejecting offer for pc_id {pc_id}: "
+                f"{len(self._pipeline_tasks)} pipelines already running"
+            )
+            await ws.send_json(
+                {
+                    "type": "error",
+                    "payload": {
+                        "error_type": "server_busy",
+                        "message": "Server busy, please try again shortly",
+                    },
+                }
+            )
+            await self._close_websocket_if_connected(
+                ws, code=1013, reason="server busy"
+            )
+            return
+
         # Set run context for logging and tracing. org_id must be set before
         # pc.initialize() so that aiortc's internal tasks inherit it.
         set_current_run_id(workflow_run_id)
@@ -638,7 +681,7 @@ class SignalingManager:
                         )
 
                 # Start pipeline in background
-                asyncio.create_task(
+                pipeline_task = asyncio.create_task(
                     run_pipeline_smallwebrtc(
                         pc,
                         workflow_id,
@@ -649,6 +692,8 @@ class SignalingManager:
                         organization_id=organization_id,
                     )
                 )
+                self._pipeline_tasks.add(pipeline_task)
+                pipeline_task.add_done_callback(self._pipeline_tasks.discard)
                 pipeline_started = True
 
                 # Get answer after initialization
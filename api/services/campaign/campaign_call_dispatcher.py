@@ -394,15 +394,14 @@ class CampaignCallDispatcher:
             )
 
             # Update workflow run as failed
-            telephony_callback_logs = workflow_run.logs.get(
-                "telephony_status_callbacks", []
-            )
             telephony_callback_log = {
                 "status": "failed",
                 "timestamp": datetime.now(UTC).isoformat(),
                 "data": {"error": str(e)},
             }
-            telephony_callback_logs.append(telephony_callback_log)
+            await db_client.append_workflow_run_log(
+                workflow_run.id, "telephony_status_callbacks", telephony_callback_log
+            )
             await db_client.update_workflow_run(
                 run_id=workflow_run.id,
                 is_completed=True,
@@ -410,9 +409,6 @@ class CampaignCallDispatcher:
                 gathered_context={
                     "error": str(e),
                 },
-                logs={
-                    "telephony_status_callbacks": telephony_callback_logs,
-                },
             )
 
             # Record call initiation failure in circuit breaker
@@ -474,6 +474,13 @@ class CampaignOrchestrator:
 
         campaigns = await db_client.get_campaigns_by_status(statuses=["running"])
 
+        # Drop activity timestamps for campaigns that left "running" without
+        # passing through _clear_campaign_state (failed batches, retries on
+        # paused campaigns); otherwise they accumulate for the process lifetime.
+        running_ids = {campaign.id for campaign in campaigns}
+        for campaign_id in self._last_activity.keys() - running_ids:
+            del self._last_activity[campaign_id]
+
         for campaign in campaigns:
             try:
                 campaign_id = campaign.id
@@ -1,13 +1,23 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from loguru import logger
 
+# Number of offending rows listed in a validation error message.
+_MAX_REPORTED_ROWS = 5
+# Stop scanning once this many invalid phone numbers have been seen; the file
+# is rejected either way and the exact total adds nothing for the user.
+_MAX_COUNTED_INVALID_ROWS = 1000
+
 
 @dataclass
 class ValidationError:
-    """Represents a validation error with details."""
+    """Represents a validation error with details.
+
+    ``invalid_rows`` holds only the first ``_MAX_REPORTED_ROWS`` offending
+    rows; the message carries the total count.
+    """
 
     message: str
     invalid_rows: Optional[List[int]] = None
@@ -23,6 +33,21 @@ class ValidationResult:
     rows: Optional[List[List[str]]] = field(default=None, repr=False)
 
 
+def _format_reported_rows(
+    reported_rows: List[int], total: int, truncated: bool = False
+) -> str:
+    """Render reported row numbers, noting how many more were left out.
+
+    ``truncated`` marks ``total`` as a lower bound because scanning stopped
+    early.
+    """
+    rows_str = ", ".join(map(str, reported_rows))
+    if total > len(reported_rows):
+        more = total - len(reported_rows)
+        rows_str = f"{rows_str} and {'at least ' if truncated else ''}{more} more"
+    return rows_str
+
+
 class CampaignSourceSyncService(ABC):
     """Base class for campaign data source synchronization"""
 
@@ -31,6 +56,14 @@ class CampaignSourceSyncService(ABC):
         """Normalize headers by stripping whitespace and lowercasing."""
         return [h.strip().lower() for h in headers]
 
+    @staticmethod
+    def header_indices(headers: List[str]) -> Dict[str, int]:
+        """Map each normalized header to the index of its first column."""
+        indices: Dict[str, int] = {}
+        for idx, header in enumerate(headers):
+            indices.setdefault(header.strip().lower(), idx)
+        return indices
+
     @staticmethod
     def validate_source_data(
         headers: List[str], rows: List[List[str]]
@@ -45,10 +78,150 @@ class CampaignSourceSyncService(ABC):
         Returns:
             ValidationResult with is_valid=True if valid, or error details if invalid
         """
-        normalized_headers = CampaignSourceSyncService.normalize_headers(headers)
+        result = CampaignSourceSyncService.validate_source_stream(headers, rows)
+        if result.is_valid:
+            result.rows = rows
+        return result
+
+    @staticmethod
+    def validate_source_stream(
+        headers: List[str],
+        rows: Iterable[List[str]],
+        required_columns: Optional[Set[str]] = None,
+    ) -> ValidationResult:
+        """
+        Validate source rows in one pass without retaining them.
+
+        Same checks as ``validate_source_data``, but ``rows`` may be any
+        iterable (e.g. a lazy ``csv.reader``) and is consumed at most once.
+        A valid result carries the normalized headers but no rows.
+
+        Args:
+            headers: List of column headers
+            rows: Iterable of data rows (excluding header)
+            required_columns: Template variable columns that must exist and be
+                non-empty in every row
+
+        Returns:
+            ValidationResult with is_valid=True if valid, or error details if invalid
+        """
+        validator = SourceRowValidator(headers, required_columns)
+        for row in rows:
+            if not validator.add(row):
+                break
+        return validator.result()
 
-        # Check for phone_number column
-        if "phone_number" not in normalized_headers:
+    @abstractmethod
+    async def validate_source(
+        self,
+        source_id: str,
+        organization_id: Optional[int] = None,
+        required_columns: Optional[Set[str]] = None,
+    ) -> ValidationResult:
+        """Validate source data before campaign creation.
+
+        ``required_columns`` are the workflow's template variables; each must
+        be a source column with a value in every row.
+        """
+        pass
+
+    @abstractmethod
+    async def sync_source_data(self, campaign_id: int) -> int:
+        """
+        Fetches data from source and creates queued_runs
+        Each record gets a unique source_uuid based on source type
+        Returns: number of records synced
+        """
+        pass
+
+    async def get_source_credentials(
+        self, organization_id: int, source_type: str
+    ) -> Dict[str, Any]:
+        """Gets source credentials when a sync service requires them."""
+        logger.info(
+            f"Getting credentials for org {organization_id}, source {source_type}"
+        )
+        return {}
+
+
+class SourceRowValidator:
+    """Validate source data one row at a time.
+
+    Runs the ``validate_source_stream`` checks for callers that receive rows
+    incrementally (e.g. from an async download). Only the first few offending
+    row numbers and the set of seen phone numbers are kept, never the rows.
+    """
+
+    def __init__(self, headers: List[str], required_columns: Optional[Set[str]] = None):
+        header_indices = CampaignSourceSyncService.header_indices(headers)
+        self._headers = headers
+        self._phone_number_idx = header_indices.get("phone_number")
+        self._missing_columns = (required_columns or set()) - header_indices.keys()
+        # Empty template values only matter once every required column exists.
+        self._template_indices: Dict[str, int] = (
+            {col: header_indices[col] for col in required_columns}
+            if required_columns and not self._missing_columns
+            else {}
+        )
+        self._empty_rows: Dict[str, List[int]] = {
+            col: [] for col in self._template_indices
+        }
+        self._empty_counts: Dict[str, int] = dict.fromkeys(self._template_indices, 0)
+        self._row_idx = 1  # 1-indexed, header is row 1
+        self._invalid_rows: List[int] = []
+        self._invalid_count = 0
+        self._duplicate_rows: List[int] = []
+        self._duplicate_count = 0
+        self._seen_phones: set[str] = set()
+
+    def add(self, row: List[str]) -> bool:
+        """Check the next data row.
+
+        Returns False once the outcome is settled and the remaining rows can
+        be skipped.
+        """
+        self._row_idx += 1
+        row_idx = self._row_idx
+        phone_number_idx = self._phone_number_idx
+        if phone_number_idx is None:
+            return False
+
+        for col, idx in self._template_indices.items():
+            if len(row) <= idx or not row[idx].strip():
+                self._empty_counts[col] += 1
+                if len(self._empty_rows[col]) < _MAX_REPORTED_ROWS:
+                    self._empty_rows[col].append(row_idx)
+
+        if len(row) <= phone_number_idx:
+            return True  # Skip rows that don't have enough columns
+
+        phone_number = row[phone_number_idx].strip()
+        if not phone_number:
+            return True
+
+        # Invalid numbers are reported first; duplicates only matter once
+        # every number is well-formed.
+        if phone_number[0] != "+":
+            self._invalid_count += 1
+            if len(self._invalid_rows) < _MAX_REPORTED_ROWS:
+                self._invalid_rows.append(row_idx)
+            elif self._invalid_count >= _MAX_COUNTED_INVALID_ROWS:
+                return False
+            return True
+
+        # add() and compare sizes: one hash per row instead of a membership
+        # test followed by an insert.
+        seen_count = len(self._seen_phones)
+        self._seen_phones.add(phone_number)
+        if len(self._seen_phones) == seen_count:
+            self._duplicate_count += 1
+            if len(self._duplicate_rows) < _MAX_REPORTED_ROWS:
+                self._duplicate_rows.append(row_idx)
+        return True
+
+    def result(self) -> ValidationResult:
+        """Outcome for the rows added so far."""
+        if self._phone_number_idx is None:
             return ValidationResult(
                 is_valid=False,
                 error=ValidationError(
@@ -56,80 +229,36 @@ class CampaignSourceSyncService(ABC):
                 ),
             )
 
-        phone_number_idx = normalized_headers.index("phone_number")
-
-        # Validate phone numbers in all data rows
-        invalid_rows = []
-        for row_idx, row in enumerate(
-            rows, start=2
-        ):  # Start at 2 (1-indexed, skip header)
-            if len(row) <= phone_number_idx:
-                continue  # Skip rows that don't have enough columns
-
-            phone_number = row[phone_number_idx].strip()
-            if phone_number and not phone_number.startswith("+"):
-                invalid_rows.append(row_idx)
-
-        if invalid_rows:
-            # Limit the number of rows shown in error message
-            if len(invalid_rows) > 5:
-                rows_str = f"{', '.join(map(str, invalid_rows[:5]))} and {len(invalid_rows) - 5} more"
-            else:
-                rows_str = ", ".join(map(str, invalid_rows))
+        if self._invalid_rows:
+            rows_str = _format_reported_rows(
+                self._invalid_rows,
+                self._invalid_count,
+                truncated=self._invalid_count >= _MAX_COUNTED_INVALID_ROWS,
+            )
 
             return ValidationResult(
                 is_valid=False,
                 error=ValidationError(
                     message=f"Invalid phone numbers in rows: {rows_str}. All phone numbers must include country code (start with '+')",
-                    invalid_rows=invalid_rows,
+                    invalid_rows=self._invalid_rows,
                 ),
             )
 
-        # Check for duplicate phone numbers
-        seen_phones: dict[str, int] = {}  # phone -> first row where it appeared
-        duplicate_rows = []
-        for row_idx, row in enumerate(rows, start=2):
-            if len(row) <= phone_number_idx:
-                continue
-
-            phone_number = row[phone_number_idx].strip()
-            if not phone_number:
-                continue
-
-            if phone_number in seen_phones:
-                duplicate_rows.append(row_idx)
-            else:
-                seen_phones[phone_number] = row_idx
-
-        if duplicate_rows:
-            if len(duplicate_rows) > 5:
-                rows_str = f"{', '.join(map(str, duplicate_rows[:5]))} and {len(duplicate_rows) - 5} more"
-            else:
-                rows_str = ", ".join(map(str, duplicate_rows))
+        if self._duplicate_rows:
+            rows_str = _format_reported_rows(
+                self._duplicate_rows, self._duplicate_count
+            )
 
             return ValidationResult(
                 is_valid=False,
                 error=ValidationError(
                     message=f"Duplicate phone numbers found in rows: {rows_str}. Phone numbers in a campaign must be unique.",
-                    invalid_rows=duplicate_rows,
+                    invalid_rows=self._duplicate_rows,
                 ),
             )
 
-        return ValidationResult(is_valid=True, headers=normalized_headers, rows=rows)
-
-    @staticmethod
-    def validate_template_columns(
-        headers: List[str],
-        rows: List[List[str]],
-        required_columns: Set[str],
-    ) -> ValidationResult:
-        """Validate that template variable columns exist and are non-empty in all rows."""
-        normalized_headers = CampaignSourceSyncService.normalize_headers(headers)
-
-        # Check for missing columns
-        missing = required_columns - set(normalized_headers)
-        if missing:
-            missing_str = ", ".join(f"'{c}'" for c in sorted(missing))
+        if self._missing_columns:
+            missing_str = ", ".join(f"'{c}'" for c in sorted(self._missing_columns))
             return ValidationResult(
                 is_valid=False,
                 error=ValidationError(
@@ -138,20 +267,9 @@ class CampaignSourceSyncService(ABC):
                 ),
             )
 
-        # Check for empty values in required columns
-        col_indices = {col: normalized_headers.index(col) for col in required_columns}
-
-        for col, idx in col_indices.items():
-            empty_rows = []
-            for row_idx, row in enumerate(rows, start=2):
-                if len(row) <= idx or not row[idx].strip():
-                    empty_rows.append(row_idx)
-
+        for col, empty_rows in self._empty_rows.items():
             if empty_rows:
-                if len(empty_rows) > 5:
-                    rows_str = f"{', '.join(map(str, empty_rows[:5]))} and {len(empty_rows) - 5} more"
-                else:
-                    rows_str = ", ".join(map(str, empty_rows))
+                rows_str = _format_reported_rows(empty_rows, self._empty_counts[col])
 
                 return ValidationResult(
                     is_valid=False,
@@ -162,29 +280,7 @@ class CampaignSourceSyncService(ABC):
                     ),
                 )
 
-        return ValidationResult(is_valid=True)
-
-    @abstractmethod
-    async def validate_source(
-        self, source_id: str, organization_id: Optional[int] = None
-    ) -> ValidationResult:
-        """Validate source data before campaign creation."""
-        pass
-
-    @abstractmethod
-    async def sync_source_data(self, campaign_id: int) -> int:
-        """
-        Fetches data from source and creates queued_runs
-        Each record gets a unique source_uuid based on source type
-        Returns: number of records synced
-        """
-        pass
-
-    async def get_source_credentials(
-        self, organization_id: int, source_type: str
-    ) -> Dict[str, Any]:
-        """Gets source credentials when a sync service requires them."""
-        logger.info(
-            f"Getting credentials for org {organization_id}, source {source_type}"
+        return ValidationResult(
+            is_valid=True,
+            headers=CampaignSourceSyncService.normalize_headers(self._headers),
         )
-        return {}
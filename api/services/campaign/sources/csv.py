@@ -1,7 +1,8 @@
 import csv
 import hashlib
+import re
 from io import StringIO
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Set
 
 import httpx
 from loguru import logger
@@ -9,17 +10,142 @@ from loguru import logger
 from api.db import db_client
 from api.services.campaign.source_sync import (
     CampaignSourceSyncService,
+    SourceRowValidator,
     ValidationError,
     ValidationResult,
 )
 from api.services.storage import storage_fs
 
+# Validation and sync both download from the same storage endpoint, so one
+# pooled client per process lets later fetches reuse kept-alive connections
+# instead of paying a fresh TCP + TLS handshake each time.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the process-wide pooled client for CSV downloads."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared CSV download client, if one was created."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+# Scanner states, mirroring where ``csv.reader`` is within a record.
+_FIELD_START = 0
+_UNQUOTED_FIELD = 1
+_QUOTED_FIELD = 2
+_QUOTE_IN_QUOTED_FIELD = 3
+
+# Outside quotes, only a line break (end of record) or a delimiter followed by
+# a quote (start of a quoted field) changes state. A quote anywhere else in an
+# unquoted field is a literal character to ``csv.reader``.
+_UNQUOTED_EVENT_RE = re.compile(r'\n|,"')
+
+
+class _RecordBoundaryScanner:
+    """Track where complete CSV records end across a stream of text chunks.
+
+    State carries over between chunks, so every character is scanned once no
+    matter how long a quoted field runs or how small the chunks are.
+    """
+
+    def __init__(self) -> None:
+        self._state = _FIELD_START
+
+    def feed(self, text: str) -> int:
+        """Scan the next chunk.
+
+        Returns the offset in ``text`` just past the last line break that ends
+        a record, or -1 if every line break in it sits inside a quoted field.
+        """
+        state = self._state
+        end = -1
+        pos = 0
+        size = len(text)
+        while pos < size:
+            if state == _QUOTE_IN_QUOTED_FIELD:
+                if text[pos] == '"':
+                    # Doubled quote: a literal quote inside the field.
+                    state = _QUOTED_FIELD
+                    pos += 1
+                    continue
+                # The quoted part closed; csv.reader keeps the rest of the
+                # field as unquoted text.
+                state = _UNQUOTED_FIELD
+            elif state == _FIELD_START:
+                if text[pos] == '"':
+                    state = _QUOTED_FIELD
+                    pos += 1
+                    continue
+                state = _UNQUOTED_FIELD
+
+            if state == _UNQUOTED_FIELD:
+                match = _UNQUOTED_EVENT_RE.search(text, pos)
+                if match is None:
+                    # A trailing delimiter means the next chunk starts a field.
+                    if text[-1] == ",":
+                        state = _FIELD_START
+                    break
+                pos = match.end()
+                if match.group() == "\n":
+                    end = pos
+                    state = _FIELD_START
+                else:
+                    state = _QUOTED_FIELD
+            else:
+                quote = text.find('"', pos)
+                if quote == -1:
+                    break
+                pos = quote + 1
+                state = _QUOTE_IN_QUOTED_FIELD
+
+        self._state = state
+        return end
+
+
+async def _iter_csv_rows(text_chunks: AsyncIterator[str]) -> AsyncIterator[List[str]]:
+    """Parse CSV rows incrementally from decoded text chunks.
+
+    Only whole records are handed to ``csv.reader``, so quoted fields with
+    embedded newlines are never split across chunk boundaries.
+    """
+    scanner = _RecordBoundaryScanner()
+    # Text of the record still being received, kept as chunks so a long
+    # record is joined once rather than re-copied on every chunk.
+    pending: List[str] = []
+    async for chunk in text_chunks:
+        end = scanner.feed(chunk)
+        if end == -1:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:end])
+        for row in csv.reader(StringIO("".join(pending))):
+            yield row
+        pending = [chunk[end:]]
+
+    text = "".join(pending)
+    if text:
+        for row in csv.reader(StringIO(text)):
+            yield row
+
 
 class CSVSyncService(CampaignSourceSyncService):
     """Implementation for CSV file synchronization"""
 
-    async def _fetch_csv_data(self, file_key: str) -> List[List[str]]:
-        """Download and parse CSV file from storage. Returns all rows including header."""
+    async def _iter_csv_data(self, file_key: str) -> AsyncIterator[List[str]]:
+        """Download a CSV file from storage, yielding rows (header first).
+
+        The body is parsed as it streams in, so neither the raw file text nor
+        the full row list has to be held in memory.
+        """
         signed_url = await storage_fs.aget_signed_url(
             file_key, expiration=3600, use_internal_endpoint=True
         )
@@ -27,41 +153,55 @@ class CSVSyncService(CampaignSourceSyncService):
         if not signed_url:
             raise ValueError(f"Failed to access CSV file: {file_key}")
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(signed_url)
+        client = _get_http_client()
+        try:
+            async with client.stream("GET", signed_url) as response:
                 response.raise_for_status()
-                csv_content = response.text
-            except httpx.HTTPError as e:
-                logger.error(f"Failed to download CSV file: {e} for url: {signed_url}")
-                raise ValueError(f"Failed to download CSV file from storage: {str(e)}")
-
-        return self._parse_csv(csv_content)
+                async for row in _iter_csv_rows(response.aiter_text()):
+                    yield row
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to download CSV file: {e} for url: {signed_url}")
+            raise ValueError(f"Failed to download CSV file from storage: {str(e)}")
+        except csv.Error as e:
+            logger.error(f"Failed to parse CSV: {e}")
+            raise ValueError(f"Invalid CSV format: {str(e)}")
 
     async def validate_source(
-        self, source_id: str, organization_id: Optional[int] = None
+        self,
+        source_id: str,
+        organization_id: Optional[int] = None,
+        required_columns: Optional[Set[str]] = None,
     ) -> ValidationResult:
-        """Validate a CSV source file for campaign creation."""
+        """Validate a CSV source file for campaign creation.
+
+        Rows are checked as they stream in and are not kept.
+        """
+        rows = self._iter_csv_data(source_id)
         try:
-            csv_data = await self._fetch_csv_data(source_id)
+            headers = await anext(rows, None)
+            first_row = await anext(rows, None) if headers is not None else None
+            if first_row is None:
+                return ValidationResult(
+                    is_valid=False,
+                    error=ValidationError(
+                        message="CSV file must have a header row and at least one data row"
+                    ),
+                )
+
+            validator = SourceRowValidator(headers, required_columns)
+            if validator.add(first_row):
+                async for row in rows:
+                    if not validator.add(row):
+                        break
         except ValueError as e:
             return ValidationResult(
                 is_valid=False,
                 error=ValidationError(message=str(e)),
             )
+        finally:
+            await rows.aclose()
 
-        if not csv_data or len(csv_data) < 2:
-            return ValidationResult(
-                is_valid=False,
-                error=ValidationError(
-                    message="CSV file must have a header row and at least one data row"
-                ),
-            )
-
-        headers = csv_data[0]
-        data_rows = csv_data[1:]
-
-        return self.validate_source_data(headers, data_rows)
+        return validator.result()
 
     async def sync_source_data(self, campaign_id: int) -> int:
         """
@@ -73,47 +213,53 @@ class CSVSyncService(CampaignSourceSyncService):
             raise ValueError(f"Campaign {campaign_id} not found")
 
         file_key = campaign.source_id
-        csv_data = await self._fetch_csv_data(file_key)
-
-        if not csv_data or len(csv_data) < 2:
-            logger.warning(f"No data found in CSV for campaign {campaign_id}")
-            return 0
 
-        headers = self.normalize_headers(csv_data[0])
-        rows = csv_data[1:]
+        # Create hash of file_key for consistent source_uuid prefix. It is only
+        # an ID, so use BLAKE2b rather than MD5, which FIPS builds reject.
+        file_hash = hashlib.blake2b(file_key.encode(), digest_size=4).hexdigest()
 
-        # Create hash of file_key for consistent source_uuid prefix
-        file_hash = hashlib.md5(file_key.encode()).hexdigest()[:8]
+        # Convert to queued_runs as rows stream in, without first collecting
+        # the whole file into a list of rows.
+        rows = self._iter_csv_data(file_key)
+        header_row = await anext(rows, None)
+        headers = self.normalize_headers(header_row) if header_row else []
+        # Last matching column, as that is the one the context dict keeps.
+        phone_number_idx = max(
+            (i for i, header in enumerate(headers) if header == "phone_number"),
+            default=None,
+        )
 
-        # Convert to queued_runs
         queued_runs = []
-        for idx, row_values in enumerate(rows, 1):
+        idx = 0
+        async for row_values in rows:
+            idx += 1
+            # Skip if no phone number, before paying for the context dict
+            if (
+                phone_number_idx is None
+                or phone_number_idx >= len(row_values)
+                or not row_values[phone_number_idx]
+            ):
+                logger.debug(f"Skipping row {idx}: no phone_number")
+                continue
+
             # Pad row to match headers length
             padded_row = row_values + [""] * (len(headers) - len(row_values))
 
             # Create context variables dict
             context_vars = dict(zip(headers, padded_row))
 
-            # Skip if no phone number
-            if not context_vars.get("phone_number"):
-                logger.debug(f"Skipping row {idx}: no phone_number")
-                continue
-
             # Generate unique source UUID: csv_{hash(source_id)}_row_{idx}
             source_uuid = f"csv_{file_hash}_row_{idx}"
 
-            queued_runs.append(
-                {
-                    "campaign_id": campaign_id,
-                    "source_uuid": source_uuid,
-                    "context_variables": context_vars,
-                    "state": "queued",
-                }
-            )
+            queued_runs.append((source_uuid, context_vars))
+
+        if idx == 0:
+            logger.warning(f"No data found in CSV for campaign {campaign_id}")
+            return 0
 
         # Bulk insert
         if queued_runs:
-            await db_client.bulk_create_queued_runs(queued_runs)
+            await db_client.bulk_create_queued_runs(campaign_id, queued_runs)
             logger.info(
                 f"Created {len(queued_runs)} queued runs for campaign {campaign_id}"
             )
@@ -126,13 +272,3 @@ class CSVSyncService(CampaignSourceSyncService):
         )
 
         return len(queued_runs)
-
-    def _parse_csv(self, csv_content: str) -> List[List[str]]:
-        """Parse CSV content into rows"""
-        try:
-            csv_file = StringIO(csv_content)
-            reader = csv.reader(csv_file)
-            return list(reader)
-        except Exception as e:
-            logger.error(f"Failed to parse CSV: {e}")
-            raise ValueError(f"Invalid CSV format: {str(e)}")
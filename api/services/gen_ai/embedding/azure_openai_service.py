@@ -84,6 +84,8 @@ class AzureOpenAIEmbeddingService(BaseEmbeddingService):
     async def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Embed a batch of texts using Azure OpenAI API."""
         self._ensure_configured()
+        if not texts:
+            return []
         try:
             response = await self.client.embeddings.create(
                 input=texts,
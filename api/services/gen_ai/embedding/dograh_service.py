@@ -55,6 +55,14 @@ class DograhEmbeddingService(OpenAIEmbeddingService):
         )
         self._correlation_id = correlation_id
 
+    def _query_cache_enabled(self) -> bool:
+        """Send every query to MPS when billing v2 is in use.
+
+        A cached answer would skip the authorization and attribution that the
+        minted correlation id exists for.
+        """
+        return not self._correlation_id
+
     def _request_kwargs(self) -> Dict[str, Any]:
         """Forward the MPS billing v2 protocol when a correlation id is present."""
         if not self._correlation_id:
@@ -5,6 +5,9 @@ Document conversion and chunking now live in the Model Proxy Service (MPS);
 this file no longer pulls docling/transformers.
 """
 
+import functools
+import hashlib
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -18,6 +21,35 @@ from .base import BaseEmbeddingService
 DEFAULT_MODEL_ID = "text-embedding-3-small"
 EMBEDDING_DIMENSION = 1536  # Dimension for text-embedding-3-small
 
+# Knowledge-base tool calls repeat the same questions across live calls, and
+# embeddings are deterministic per model, so recent query vectors are kept in
+# process. Keyed on (base_url, api key hash, model id, query) so one credential
+# set never answers for another.
+_QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 4096
+_query_embedding_cache: OrderedDict[
+    tuple[Optional[str], str, str, str], List[float]
+] = OrderedDict()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_client(
+    api_key: str,
+    base_url: Optional[str],
+    default_headers: Optional[tuple[tuple[str, str], ...]],
+) -> AsyncOpenAI:
+    """Share one pooled client per credential set.
+
+    A service is built for every knowledge-base search during a call; reusing
+    the client keeps its connection pool instead of paying a fresh TLS
+    handshake per query.
+    """
+    client_kwargs: Dict[str, Any] = {"api_key": api_key}
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    if default_headers:
+        client_kwargs["default_headers"] = dict(default_headers)
+    return AsyncOpenAI(**client_kwargs)
+
 
 class EmbeddingAPIKeyNotConfiguredError(Exception):
     """Raised when OpenAI API key is not configured for embeddings."""
@@ -51,19 +83,23 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
         """
         self.db = db_client
         self.model_id = model_id
+        self._base_url = base_url or None
+        self._api_key_hash = (
+            hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+        )
 
         self._api_key_configured = bool(api_key)
         if self._api_key_configured:
-            client_kwargs = {"api_key": api_key}
             if base_url:
                 validate_user_configured_service_url(
                     base_url,
                     field_name="base_url",
                 )
-                client_kwargs["base_url"] = base_url
-            if default_headers:
-                client_kwargs["default_headers"] = default_headers
-            self.client = AsyncOpenAI(**client_kwargs)
+            self.client = _get_client(
+                api_key,
+                base_url or None,
+                tuple(sorted(default_headers.items())) if default_headers else None,
+            )
             logger.info(f"OpenAI embedding service initialized with model: {model_id}")
         else:
             self.client = None
@@ -93,6 +129,14 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
         """
         return {}
 
+    def _query_cache_enabled(self) -> bool:
+        """Whether embed_query may answer repeated queries from the cache.
+
+        Override hook for subclasses whose requests must always reach the
+        provider (e.g. DograhEmbeddingService under MPS billing v2).
+        """
+        return True
+
     async def embed_texts(self, texts: List[str]) -> List[List[float]]:
         """Embed a batch of texts using OpenAI API.
 
@@ -100,6 +144,8 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
             EmbeddingAPIKeyNotConfiguredError: If API key is not configured.
         """
         self._ensure_api_key_configured()
+        if not texts:
+            return []
 
         try:
             response = await self.client.embeddings.create(
@@ -119,8 +165,22 @@ class OpenAIEmbeddingService(BaseEmbeddingService):
             EmbeddingAPIKeyNotConfiguredError: If API key is not configured.
         """
         self._ensure_api_key_configured()
+        if not self._query_cache_enabled():
+            embeddings = await self.embed_texts([query])
+            return embeddings[0]
+
+        cache_key = (self._base_url, self._api_key_hash, self.model_id, query)
+        cached = _query_embedding_cache.get(cache_key)
+        if cached is not None:
+            _query_embedding_cache.move_to_end(cache_key)
+            return cached
+
         embeddings = await self.embed_texts([query])
-        return embeddings[0]
+        embedding = embeddings[0]
+        _query_embedding_cache[cache_key] = embedding
+        if len(_query_embedding_cache) > _QUERY_EMBEDDING_CACHE_MAX_ENTRIES:
+            _query_embedding_cache.popitem(last=False)
+        return embedding
 
     async def search_similar_chunks(
         self,
@@ -6,6 +6,11 @@ import json
 import re
 from typing import Any
 
+# Matches ```json ... ``` or ``` ... ``` markdown code block wrappers.
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+
+_DECODER = json.JSONDecoder()
+
 
 def parse_llm_json(raw_content: str) -> dict[str, Any]:
     """Parse JSON from LLM output, handling common formatting issues.
@@ -21,20 +26,17 @@ def parse_llm_json(raw_content: str) -> dict[str, Any]:
     Returns:
         Parsed JSON as a dictionary. If parsing fails, returns {"raw": raw_content}.
     """
-    if not raw_content or not raw_content.strip():
+    content = raw_content.strip() if raw_content else ""
+    if not content:
         return {}
 
-    content = raw_content.strip()
-
     # Attempt 1: Direct parse (ideal case)
     parsed = _try_parse_json(content)
     if parsed is not None:
         return parsed
 
     # Attempt 2: Remove markdown code block wrappers
-    # Matches ```json ... ``` or ``` ... ```
-    code_block_pattern = r"```(?:json)?\s*([\s\S]*?)\s*```"
-    code_block_match = re.search(code_block_pattern, content)
+    code_block_match = "```" in content and _CODE_BLOCK_RE.search(content)
     if code_block_match:
         extracted = code_block_match.group(1).strip()
         parsed = _try_parse_json(extracted)
@@ -58,7 +60,7 @@ def parse_llm_json(raw_content: str) -> dict[str, Any]:
 def _try_parse_json(content: str) -> dict[str, Any] | list | None:
     """Attempt to parse JSON, returning None on failure."""
     try:
-        result = json.loads(content)
+        result = _DECODER.decode(content)
         if isinstance(result, (dict, list)):
             return result
         return None
@@ -67,88 +69,29 @@ def _try_parse_json(content: str) -> dict[str, Any] | list | None:
 
 
 def _extract_json_object(content: str) -> dict[str, Any] | None:
-    """Extract a JSON object from text by finding matching braces."""
-    # Find the first opening brace
+    """Extract the JSON object starting at the first opening brace."""
     start = content.find("{")
     if start == -1:
         return None
-
-    # Find matching closing brace by counting braces
-    depth = 0
-    in_string = False
-    escape_next = False
-    end = -1
-
-    for i, char in enumerate(content[start:], start=start):
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == "\\":
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == "{":
-            depth += 1
-        elif char == "}":
-            depth -= 1
-            if depth == 0:
-                end = i
-                break
-
-    if end == -1:
-        return None
-
-    json_str = content[start : end + 1]
-    return _try_parse_json(json_str)
+    return _decode_from(content, start)
 
 
 def _extract_json_array(content: str) -> list | None:
-    """Extract a JSON array from text by finding matching brackets."""
-    # Find the first opening bracket
+    """Extract the JSON array starting at the first opening bracket."""
     start = content.find("[")
     if start == -1:
         return None
+    return _decode_from(content, start)
 
-    # Find matching closing bracket by counting brackets
-    depth = 0
-    in_string = False
-    escape_next = False
-    end = -1
-
-    for i, char in enumerate(content[start:], start=start):
-        if escape_next:
-            escape_next = False
-            continue
-
-        if char == "\\":
-            escape_next = True
-            continue
-
-        if char == '"' and not escape_next:
-            in_string = not in_string
-            continue
-
-        if in_string:
-            continue
-
-        if char == "[":
-            depth += 1
-        elif char == "]":
-            depth -= 1
-            if depth == 0:
-                end = i
-                break
-
-    if end == -1:
-        return None
 
-    json_str = content[start : end + 1]
-    return _try_parse_json(json_str)
+def _decode_from(content: str, start: int) -> dict[str, Any] | list | None:
+    """Decode the JSON value at ``start``, ignoring any text after it.
+
+    ``raw_decode`` matches braces, strings and escapes in the C decoder and
+    returns the parsed value in the same pass.
+    """
+    try:
+        result, _ = _DECODER.raw_decode(content, start)
+    except json.JSONDecodeError:
+        return None
+    return result
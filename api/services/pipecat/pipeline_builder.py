@@ -1,8 +1,8 @@
-import os
-
 from loguru import logger
 
+from api.constants import ENABLE_TURN_LOGGING
 from api.services.pipecat.audio_config import AudioConfig
+from api.services.pipecat.turn_context import get_turn_context_manager
 from pipecat.pipeline.pipeline import Pipeline
 from pipecat.pipeline.worker import PipelineParams, PipelineWorker
 from pipecat.processors.aggregators.llm_context import LLMContext
@@ -205,22 +205,17 @@ def create_pipeline_task(
         additional_span_attributes=additional_span_attributes,
     )
 
-    # Check if turn logging is enabled
-    enable_turn_logging = os.getenv("ENABLE_TURN_LOGGING", "false").lower() == "true"
-
-    if enable_turn_logging:
+    if ENABLE_TURN_LOGGING:
         # Attach event handlers to propagate turn information into the logging context
         turn_observer = task.turn_tracking_observer
 
         if turn_observer is not None:
-            # Import turn context manager only if needed
-            from api.services.pipecat.turn_context import get_turn_context_manager
+            turn_manager = get_turn_context_manager()
 
             async def _on_turn_started(observer, turn_number: int):
                 """Set the current turn number into the context variable."""
                 # Set in both contextvar and turn context manager
                 turn_var.set(turn_number)
-                turn_manager = get_turn_context_manager()
                 turn_manager.set_turn(turn_number)
 
             # Register the handlers with the observer
@@ -21,7 +21,8 @@ node changes.
 """
 
 import json
-from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Set
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 from loguru import logger
 
@@ -49,15 +50,11 @@ if TYPE_CHECKING:
 from pipecat.frames.frames import (
     BotStartedSpeakingFrame,
     BotStoppedSpeakingFrame,
-    CancelFrame,
-    EndFrame,
     ErrorFrame,
     FunctionCallInProgressFrame,
     FunctionCallResultFrame,
     InterimTranscriptionFrame,
-    InterruptionFrame,
     MetricsFrame,
-    StopFrame,
     TranscriptionFrame,
     TTSSpeakFrame,
     TTSTextFrame,
@@ -70,6 +67,33 @@ from pipecat.processors.frame_processor import FrameDirection
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.utils.enums import RealtimeFeedbackType
 
+# A frame is re-observed at each hop, normally within moments, so only recent
+# ids need remembering. Only _HANDLED_FRAME_TYPES reach the cache: TTS words
+# and interim transcriptions while someone is speaking, plus a few speaking,
+# mute, metrics and function call frames per turn. That is at most a few tens
+# per second, so the cap covers minutes of traffic while keeping long calls at
+# constant memory.
+_MAX_FRAMES_SEEN = 4096
+
+# Frame types with a branch in on_push_frame. Everything else (audio, LLM
+# tokens, control frames) is most of the traffic and is dropped before the
+# dedupe and the isinstance cascade. Resolved once per concrete type.
+_HANDLED_FRAME_TYPES = (
+    BotStartedSpeakingFrame,
+    BotStoppedSpeakingFrame,
+    UserMuteStartedFrame,
+    UserMuteStoppedFrame,
+    InterimTranscriptionFrame,
+    TranscriptionFrame,
+    TTSSpeakFrame,
+    TTSTextFrame,
+    FunctionCallInProgressFrame,
+    FunctionCallResultFrame,
+    MetricsFrame,
+    ErrorFrame,
+)
+_is_handled_frame_type: dict[type, bool] = {}
+
 
 class RealtimeFeedbackObserver(BaseObserver):
     """Observer that sends real-time events via WebSocket and persists final transcripts.
@@ -102,7 +126,7 @@ class RealtimeFeedbackObserver(BaseObserver):
         super().__init__()
         self._ws_sender = ws_sender
         self._logs_buffer = logs_buffer
-        self._frames_seen: Set[str] = set()
+        self._frames_seen: OrderedDict[int, None] = OrderedDict()
 
     async def cleanup(self):
         """Clean up resources. Must be called when the observer is no longer needed."""
@@ -111,6 +135,14 @@ class RealtimeFeedbackObserver(BaseObserver):
     async def on_push_frame(self, data: FramePushed):
         """Process frames and send relevant ones to the client."""
         frame = data.frame
+        frame_type = type(frame)
+        handled = _is_handled_frame_type.get(frame_type)
+        if handled is None:
+            handled = issubclass(frame_type, _HANDLED_FRAME_TYPES)
+            _is_handled_frame_type[frame_type] = handled
+        if not handled:
+            return
+
         frame_direction = data.direction
         source = data.source
 
@@ -122,6 +154,7 @@ class RealtimeFeedbackObserver(BaseObserver):
         # transcription siblings are still handled only on the downstream copy to
         # avoid duplicate live UI messages.
         if frame.id in self._frames_seen:
+            self._frames_seen.move_to_end(frame.id)
             return
         if frame_direction != FrameDirection.DOWNSTREAM:
             is_upstream_transcription = (
@@ -139,14 +172,14 @@ class RealtimeFeedbackObserver(BaseObserver):
         ):
             return
 
-        self._frames_seen.add(frame.id)
+        self._frames_seen[frame.id] = None
+        if len(self._frames_seen) > _MAX_FRAMES_SEEN:
+            self._frames_seen.popitem(last=False)
 
         logger.trace(f"{self} Received Frame: {frame} Direction: {frame_direction}")
 
-        if isinstance(frame, (EndFrame, CancelFrame, StopFrame, InterruptionFrame)):
-            return
         # Bot speaking state - WS only (ephemeral state signals, not persisted)
-        elif isinstance(frame, BotStartedSpeakingFrame):
+        if isinstance(frame, BotStartedSpeakingFrame):
             await self._send_ws(
                 {"type": RealtimeFeedbackType.BOT_STARTED_SPEAKING.value, "payload": {}}
             )
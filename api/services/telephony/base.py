@@ -4,10 +4,11 @@ This allows easy switching between different providers (Twilio, Vonage, etc.)
 while keeping business logic decoupled from specific implementations.
 """
 
+import asyncio
 import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
@@ -184,6 +185,22 @@ class TelephonyProvider(ABC):
         """
         pass
 
+    # Signature checks that hash more than this many bytes run in a worker
+    # thread; below it the thread hop costs more than the hash itself.
+    SIGNATURE_OFFLOAD_THRESHOLD_BYTES = 4096
+
+    async def _run_signature_check(
+        self, check: Callable[[], bool], payload_size: int
+    ) -> bool:
+        """Run a synchronous signature check without stalling the event loop.
+
+        hashlib and libsodium release the GIL, so large bodies are verified
+        via ``asyncio.to_thread`` while other calls keep being served.
+        """
+        if payload_size > self.SIGNATURE_OFFLOAD_THRESHOLD_BYTES:
+            return await asyncio.to_thread(check)
+        return check()
+
     @abstractmethod
     async def get_webhook_response(
         self, workflow_id: int, organization_id: int, workflow_run_id: int
@@ -4,6 +4,7 @@ Handles transfer event publishing, subscription, and context storage
 """
 
 import asyncio
+import json
 import time
 from typing import Dict, Optional
 
@@ -25,13 +26,21 @@ class CallTransferManager:
     def __init__(self, redis_client: Optional[aioredis.Redis] = None):
         self._redis_client = redis_client
         self._pubsub_connections: Dict[str, aioredis.client.PubSub] = {}
+        self._redis_lock = asyncio.Lock()
 
     async def _get_redis(self) -> aioredis.Redis:
-        """Get Redis client instance."""
-        if not self._redis_client:
-            self._redis_client = await aioredis.from_url(
-                REDIS_URL, decode_responses=True
-            )
+        """Get Redis client instance.
+
+        The first webhooks after startup can arrive together; the lock makes
+        sure they share one client instead of each opening (and leaking) one.
+        """
+        if self._redis_client:
+            return self._redis_client
+        async with self._redis_lock:
+            if not self._redis_client:
+                self._redis_client = await aioredis.from_url(
+                    REDIS_URL, decode_responses=True
+                )
         return self._redis_client
 
     async def store_transfer_context(
@@ -88,6 +97,41 @@ class CallTransferManager:
         key = TransferRedisChannels.transfer_step_key(transfer_id, step)
         return bool(await redis.set(key, "1", ex=ttl, nx=True))
 
+    async def record_transfer_step_result(
+        self, transfer_id: str, step: str, result: dict, ttl: int = 300
+    ) -> None:
+        """Attach the response of a claimed step so retries can replay it."""
+        try:
+            redis = await self._get_redis()
+            key = TransferRedisChannels.transfer_step_key(transfer_id, step)
+            await redis.set(key, json.dumps(result), ex=ttl, xx=True)
+        except Exception as e:
+            logger.error(f"Failed to record transfer step result: {e}")
+
+    async def get_transfer_step_result(
+        self, transfer_id: str, step: str
+    ) -> Optional[dict]:
+        """Return the response recorded for a step, if its handler finished."""
+        try:
+            redis = await self._get_redis()
+            key = TransferRedisChannels.transfer_step_key(transfer_id, step)
+            data = await redis.get(key)
+            result = json.loads(data) if data else None
+            return result if isinstance(result, dict) else None
+        except Exception as e:
+            logger.error(f"Failed to get transfer step result: {e}")
+            return None
+
+    async def release_transfer_step(self, transfer_id: str, step: str) -> None:
+        """Release a claimed step so a retried delivery can handle it again."""
+        try:
+            redis = await self._get_redis()
+            await redis.delete(
+                TransferRedisChannels.transfer_step_key(transfer_id, step)
+            )
+        except Exception as e:
+            logger.error(f"Failed to release transfer step: {e}")
+
     async def remove_transfer_context(self, transfer_id: str) -> None:
         """Remove transfer context from Redis.
 
@@ -131,11 +175,14 @@ class CallTransferManager:
                 f"[Transfer Manager] Error storing transfer channel mapping: {e}"
             )
 
-    async def publish_transfer_event(self, event: TransferEvent) -> None:
+    async def publish_transfer_event(self, event: TransferEvent) -> bool:
         """Publish transfer event to Redis channel.
 
         Args:
             event: Transfer event to publish
+
+        Returns:
+            True if the event was published, False if publishing failed
         """
         try:
             # Add timestamp if not present
@@ -146,8 +193,10 @@ class CallTransferManager:
             channel = TransferRedisChannels.transfer_events(event.transfer_id)
             await redis.publish(channel, event.to_json())
             logger.info(f"Published {event.type} event for {event.transfer_id}")
+            return True
         except Exception as e:
             logger.error(f"Failed to publish transfer event: {e}")
+            return False
 
     async def wait_for_transfer_completion(
         self, transfer_id: str, timeout_seconds: float = 30.0
@@ -0,0 +1,36 @@
+"""Shared aiohttp session for outbound telephony provider API calls.
+
+Creating a ``ClientSession`` per request throws away the connection pool, so
+every provider call pays a fresh TCP + TLS handshake. Call transfers sit on
+the live-call latency path, so they reuse one pooled session per process.
+The session is closed from the FastAPI lifespan shutdown hook.
+"""
+
+from typing import Optional
+
+import aiohttp
+
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Get or create the process-wide pooled aiohttp session.
+
+    Callers must not close the returned session.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200, ttl_dns_cache=300, keepalive_timeout=60
+            )
+        )
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared session, if one was created."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
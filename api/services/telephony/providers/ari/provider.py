@@ -21,6 +21,7 @@ from api.services.telephony.base import (
     ProviderSyncResult,
     TelephonyProvider,
 )
+from api.services.telephony.http_session import get_http_session
 from api.services.telephony.providers.ari.external_pbx import create_adapter
 
 if TYPE_CHECKING:
@@ -483,21 +484,21 @@ class ARIProvider(TelephonyProvider):
                 "timeout": timeout,  # Keep timeout for transfer calls
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    endpoint,
-                    params=params,
-                    auth=self._get_auth(),
-                ) as response:
-                    response_text = await response.text()
+            session = await get_http_session()
+            async with session.post(
+                endpoint,
+                params=params,
+                auth=self._get_auth(),
+            ) as response:
+                response_text = await response.text()
 
-                    if response.status != 200:
-                        error_msg = f"ARI channel creation failed: {response.status} {response_text}"
-                        logger.error(f"[ARI Transfer] {error_msg}")
-                        await call_transfer_manager.remove_transfer_context(transfer_id)
-                        raise Exception(error_msg)
+                if response.status != 200:
+                    error_msg = f"ARI channel creation failed: {response.status} {response_text}"
+                    logger.error(f"[ARI Transfer] {error_msg}")
+                    await call_transfer_manager.remove_transfer_context(transfer_id)
+                    raise Exception(error_msg)
 
-                    result = json.loads(response_text)
+                result = json.loads(response_text)
 
             destination_channel_id = result.get("id", "")
             if not destination_channel_id:
@@ -21,6 +21,7 @@ from api.services.telephony.base import (
     ProviderSyncResult,
     TelephonyProvider,
 )
+from api.services.telephony.http_session import get_http_session
 from api.services.workflow.initial_context import merge_external_initial_context
 from api.utils.common import get_backend_endpoints
 from api.utils.telephony_address import normalize_telephony_address
@@ -1181,38 +1182,38 @@ class CloudonixProvider(TelephonyProvider):
             f"{conference_name} (transfer_id={transfer_id})"
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(endpoint, json=data, headers=headers) as response:
-                response_text = await response.text()
-                if response.status != 200:
-                    logger.error(
-                        f"[Cloudonix Transfer] Dial failed: HTTP {response.status}, "
-                        f"body: {response_text}"
-                    )
-                    raise Exception(
-                        f"Cloudonix transfer dial failed (HTTP {response.status}): "
-                        f"{response_text}"
-                    )
-
-                response_data = await response.json()
-                session_token = response_data.get("token")
-                if not session_token:
-                    raise Exception(
-                        "No session token returned from Cloudonix transfer dial"
-                    )
+        session = await get_http_session()
+        async with session.post(endpoint, json=data, headers=headers) as response:
+            response_text = await response.text()
+            if response.status != 200:
+                logger.error(
+                    f"[Cloudonix Transfer] Dial failed: HTTP {response.status}, "
+                    f"body: {response_text}"
+                )
+                raise Exception(
+                    f"Cloudonix transfer dial failed (HTTP {response.status}): "
+                    f"{response_text}"
+                )
 
-                logger.info(
-                    f"[Cloudonix Transfer] Destination leg initiated "
-                    f"(token={session_token}, transfer_id={transfer_id})"
+            response_data = await response.json()
+            session_token = response_data.get("token")
+            if not session_token:
+                raise Exception(
+                    "No session token returned from Cloudonix transfer dial"
                 )
-                return {
-                    "call_sid": session_token,
-                    "status": response_data.get("status", "initiated"),
-                    "provider": self.PROVIDER_NAME,
-                    "from_number": from_number,
-                    "to_number": destination,
-                    "raw_response": response_data,
-                }
+
+            logger.info(
+                f"[Cloudonix Transfer] Destination leg initiated "
+                f"(token={session_token}, transfer_id={transfer_id})"
+            )
+            return {
+                "call_sid": session_token,
+                "status": response_data.get("status", "initiated"),
+                "provider": self.PROVIDER_NAME,
+                "from_number": from_number,
+                "to_number": destination,
+                "raw_response": response_data,
+            }
 
     def supports_transfers(self) -> bool:
         """Cloudonix supports conference-based call transfers."""
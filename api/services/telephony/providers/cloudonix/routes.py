@@ -5,18 +5,20 @@ provider registry — see ProviderSpec.router.
 """
 
 import json
+from typing import Any, Optional
 
 from fastapi import APIRouter, Request
 from loguru import logger
 from pipecat.utils.run_context import set_current_run_id
+from pydantic import BaseModel, ConfigDict, ValidationError
 
 from api.db import db_client
 from api.services.telephony.call_transfer_manager import get_call_transfer_manager
-from api.services.telephony.factory import get_telephony_provider_for_run
 from api.services.telephony.providers.cloudonix.provider import CloudonixProvider
 from api.services.telephony.status_processor import (
     StatusCallbackRequest,
     _process_status_update,
+    handle_provider_status_callback,
 )
 from api.services.telephony.transfer_event_protocol import (
     TransferEvent,
@@ -25,6 +27,23 @@ from api.services.telephony.transfer_event_protocol import (
 
 router = APIRouter()
 
+
+class CloudonixCDR(BaseModel):
+    """Envelope of a Cloudonix CDR webhook.
+
+    Only the fields the route keys on are declared; the rest of the record
+    is kept (``extra="allow"``) for ``parse_cdr_status_callback``. They stay
+    optional so a partial CDR gets a specific error instead of a generic
+    validation failure.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    domain: Optional[str] = None
+    session: Any = None
+    disposition: Optional[str] = None
+
+
 # Cloudonix session statuses that terminate a transfer without an answer.
 _CLOUDONIX_TRANSFER_FAILURE_STATUSES = {
     "busy",
@@ -38,7 +57,9 @@ _CLOUDONIX_TRANSFER_FAILURE_STATUSES = {
 
 
 @router.post("/cloudonix/transfer-result/{transfer_id}")
-async def handle_cloudonix_transfer_result(transfer_id: str, request: Request):
+async def handle_cloudonix_transfer_result(
+    transfer_id: str, request: Request
+) -> dict[str, str]:
     """Drive transfer completion from the destination leg's session status.
 
     ``CloudonixProvider.transfer_call`` sets this URL as the outbound call
@@ -117,7 +138,7 @@ async def handle_cloudonix_transfer_result(transfer_id: str, request: Request):
 async def handle_cloudonix_status_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Cloudonix-specific status callbacks.
 
     Cloudonix sends call status updates to the callback URL specified during call initiation.
@@ -137,44 +158,11 @@ async def handle_cloudonix_status_callback(
         f"[run {workflow_run_id}] Received Cloudonix status callback: {json.dumps(callback_data)}"
     )
 
-    # Get workflow run to find organization
-    workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
-    if not workflow_run:
-        logger.warning(f"Workflow run {workflow_run_id} not found for status callback")
-        return {"status": "ignored", "reason": "workflow_run_not_found"}
-
-    # Get workflow and provider
-    workflow = await db_client.get_workflow_by_id(workflow_run.workflow_id)
-    if not workflow:
-        logger.warning(f"Workflow {workflow_run.workflow_id} not found")
-        return {"status": "ignored", "reason": "workflow_not_found"}
-
-    provider = await get_telephony_provider_for_run(
-        workflow_run, workflow.organization_id
-    )
-
-    # Parse the callback data into generic format
-    parsed_data = provider.parse_status_callback(callback_data)
-
-    # Create StatusCallbackRequest from parsed data
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        direction=parsed_data.get("direction"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
-    )
-
-    # Process the status update
-    await _process_status_update(workflow_run_id, status_update)
-
-    return {"status": "success"}
+    return await handle_provider_status_callback(workflow_run_id, callback_data)
 
 
 @router.post("/cloudonix/cdr")
-async def handle_cloudonix_cdr(request: Request):
+async def handle_cloudonix_cdr(request: Request) -> dict[str, str]:
     """Handle Cloudonix CDR (Call Detail Record) webhooks.
 
     Cloudonix sends CDR records when calls complete. The CDR contains:
@@ -183,20 +171,21 @@ async def handle_cloudonix_cdr(request: Request):
     - disposition: Call termination status (ANSWER, BUSY, CANCEL, FAILED, CONGESTION, NOANSWER)
     - duration/billsec: Call duration information
     """
+    # Parse and shape-check in pydantic-core rather than stdlib json.
     try:
-        cdr_data = await request.json()
-    except Exception as e:
+        cdr = CloudonixCDR.model_validate_json(await request.body())
+    except ValidationError as e:
         logger.error(f"Failed to parse Cloudonix CDR JSON: {e}")
         return {"status": "error", "message": "Invalid JSON payload"}
+    cdr_data = cdr.model_dump()
 
     # Extract domain to find organization
-    domain = cdr_data.get("domain")
-    if not domain:
+    if not cdr.domain:
         logger.warning("Cloudonix CDR missing domain field")
         return {"status": "error", "message": "Missing domain field"}
 
     # Extract call_id to find workflow run
-    session = cdr_data.get("session")
+    session = cdr.session
     call_id = session.get("token") if isinstance(session, dict) else None
     logger.info(f"Cloudonix CDR data for call id {call_id} - {cdr_data}")
     if not call_id:
@@ -214,21 +203,14 @@ async def handle_cloudonix_cdr(request: Request):
     logger.info(f"[run {workflow_run_id}] Processing Cloudonix CDR for call {call_id}")
 
     parsed_data = CloudonixProvider.parse_cdr_status_callback(cdr_data)
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
-    )
+    status_update = StatusCallbackRequest.from_parsed(parsed_data)
 
     # Process the status update
     await _process_status_update(workflow_run_id, status_update)
 
     logger.info(
         f"[run {workflow_run_id}] Cloudonix CDR processed successfully - "
-        f"disposition: {cdr_data.get('disposition')}, status: {status_update.status}"
+        f"disposition: {cdr.disposition}, status: {status_update.status}"
     )
 
     return {"status": "success"}
@@ -5,6 +5,7 @@ from typing import Any, Dict
 from loguru import logger
 from pipecat.serializers.call_strategies import HangupStrategy, TransferStrategy
 
+from api.services.telephony.call_transfer_manager import get_call_transfer_manager
 from api.services.telephony.providers.cloudonix.provider import CLOUDONIX_API_BASE_URL
 
 
@@ -101,10 +102,6 @@ class CloudonixConferenceStrategy(TransferStrategy):
 
     async def _find_transfer_context_for_call(self, call_sid: str):
         try:
-            from api.services.telephony.call_transfer_manager import (
-                get_call_transfer_manager,
-            )
-
             manager = await get_call_transfer_manager()
             return await manager.find_transfer_context_for_call(call_sid)
         except Exception as e:
@@ -113,10 +110,6 @@ class CloudonixConferenceStrategy(TransferStrategy):
 
     async def _cleanup_transfer_context(self, transfer_id: str):
         try:
-            from api.services.telephony.call_transfer_manager import (
-                get_call_transfer_manager,
-            )
-
             manager = await get_call_transfer_manager()
             await manager.remove_transfer_context(transfer_id)
         except Exception as e:
@@ -23,6 +23,7 @@ from api.services.telephony.base import (
     ProviderSyncResult,
     TelephonyProvider,
 )
+from api.services.telephony.http_session import get_http_session
 from api.utils.common import get_backend_endpoints
 from api.utils.telephony_address import normalize_telephony_address
 
@@ -623,48 +624,46 @@ class PlivoProvider(TelephonyProvider):
                 f"to destination={destination}"
             )
 
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.auth_id, self.auth_token)
-
-                async with session.post(endpoint, json=data, auth=auth) as response:
-                    response_status = response.status
-                    response_text = await response.text()
-
-                    logger.info(
-                        f"Plivo transfer destination API response: {response_status}"
-                    )
+            session = await get_http_session()
+            auth = aiohttp.BasicAuth(self.auth_id, self.auth_token)
 
-                    if response_status not in (200, 201, 202):
-                        error_msg = (
-                            f"Plivo API call failed with status "
-                            f"{response_status}: {response_text}"
-                        )
-                        logger.error(error_msg)
-                        raise Exception(error_msg)
+            async with session.post(endpoint, json=data, auth=auth) as response:
+                response_status = response.status
+                response_text = await response.text()
 
-                    try:
-                        response_data = json.loads(response_text)
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to parse Plivo transfer response JSON: {e}"
-                        )
-                        raise Exception(f"Failed to parse transfer response: {e}")
+                logger.info(
+                    f"Plivo transfer destination API response: {response_status}"
+                )
 
-                    request_uuid = response_data.get("request_uuid")
-                    if not request_uuid:
-                        raise Exception(
-                            f"Plivo transfer response missing request_uuid: {response_data}"
-                        )
-                    logger.info(f"Plivo transfer destination initiated: {request_uuid}")
-
-                return {
-                    "call_sid": request_uuid,
-                    "status": "queued",
-                    "provider": self.PROVIDER_NAME,
-                    "from_number": from_number,
-                    "to_number": destination,
-                    "raw_response": response_data,
-                }
+                if response_status not in (200, 201, 202):
+                    error_msg = (
+                        f"Plivo API call failed with status "
+                        f"{response_status}: {response_text}"
+                    )
+                    logger.error(error_msg)
+                    raise Exception(error_msg)
+
+                try:
+                    response_data = json.loads(response_text)
+                except Exception as e:
+                    logger.error(f"Failed to parse Plivo transfer response JSON: {e}")
+                    raise Exception(f"Failed to parse transfer response: {e}")
+
+                request_uuid = response_data.get("request_uuid")
+                if not request_uuid:
+                    raise Exception(
+                        f"Plivo transfer response missing request_uuid: {response_data}"
+                    )
+                logger.info(f"Plivo transfer destination initiated: {request_uuid}")
+
+            return {
+                "call_sid": request_uuid,
+                "status": "queued",
+                "provider": self.PROVIDER_NAME,
+                "from_number": from_number,
+                "to_number": destination,
+                "raw_response": response_data,
+            }
 
         except Exception as e:
             logger.error(f"Error initiating Plivo transfer call: {e}")
@@ -10,7 +10,7 @@ from xml.sax.saxutils import escape
 from fastapi import APIRouter, Request
 from loguru import logger
 from pipecat.utils.run_context import set_current_run_id
-from starlette.responses import HTMLResponse
+from starlette.responses import HTMLResponse, Response
 
 from api.db import db_client
 from api.services.telephony.call_transfer_manager import get_call_transfer_manager
@@ -27,30 +27,32 @@ from api.services.telephony.transfer_event_protocol import (
 router = APIRouter()
 
 
-def _hangup_xml_response() -> HTMLResponse:
-    return HTMLResponse(
-        content='<?xml version="1.0" encoding="UTF-8"?><Response><Hangup/></Response>',
-        media_type="application/xml",
-    )
+# Static Plivo XML bodies, encoded once at import. Only the conference name
+# varies per request.
+_HANGUP_XML = b'<?xml version="1.0" encoding="UTF-8"?><Response><Hangup/></Response>'
+_CONFERENCE_XML_TEMPLATE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Speak>You have answered a transfer call. Connecting you now.</Speak>
+    <Conference endConferenceOnExit="true">%b</Conference>
+</Response>"""
 
 
-def _conference_xml_response(conference_name: str) -> HTMLResponse:
+def _hangup_xml_response() -> Response:
+    return Response(content=_HANGUP_XML, media_type="application/xml")
+
+
+def _conference_xml_response(conference_name: str) -> Response:
     # Plivo joins a call to a standard conference through Conference XML;
     # its Conference REST API only manages participants already in the conference.
     # https://docs.plivo.com/docs/voice/xml/conference
-    safe_conference_name = escape(conference_name)
-    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Speak>You have answered a transfer call. Connecting you now.</Speak>
-    <Conference endConferenceOnExit="true">{safe_conference_name}</Conference>
-</Response>"""
-    return HTMLResponse(content=xml, media_type="application/xml")
+    xml = _CONFERENCE_XML_TEMPLATE % escape(conference_name).encode("utf-8")
+    return Response(content=xml, media_type="application/xml")
 
 
 async def _handle_plivo_status_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     set_current_run_id(workflow_run_id)
 
     form_data = await request.form()
@@ -83,15 +85,7 @@ async def _handle_plivo_status_callback(
         return {"status": "error", "reason": "invalid_signature"}
 
     parsed_data = provider.parse_status_callback(callback_data)
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        direction=parsed_data.get("direction"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
-    )
+    status_update = StatusCallbackRequest.from_parsed(parsed_data)
 
     await _process_status_update(workflow_run_id, status_update)
     return {"status": "success"}
@@ -144,7 +138,7 @@ async def handle_plivo_xml_webhook(
 async def handle_plivo_hangup_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Plivo hangup callbacks."""
     return await _handle_plivo_status_callback(workflow_run_id, request)
 
@@ -153,7 +147,7 @@ async def handle_plivo_hangup_callback(
 async def handle_plivo_ring_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Plivo ring callbacks."""
     return await _handle_plivo_status_callback(workflow_run_id, request)
 
@@ -242,7 +236,9 @@ async def handle_plivo_transfer_xml(
 
 
 @router.post("/plivo/transfer-result/{transfer_id}", include_in_schema=False)
-async def handle_plivo_transfer_result(transfer_id: str, request: Request):
+async def handle_plivo_transfer_result(
+    transfer_id: str, request: Request
+) -> dict[str, str]:
     """
     Plivo hangup callback for the outbound transfer destination.
 
@@ -6,6 +6,7 @@ inline WebSocket media streaming.
 
 import base64
 import binascii
+import functools
 import json
 import time
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
@@ -33,6 +34,7 @@ from api.services.telephony.base import (
     ProviderSyncResult,
     TelephonyProvider,
 )
+from api.services.telephony.http_session import get_http_session
 from api.utils.common import get_backend_endpoints
 from api.utils.telephony_address import normalize_telephony_address
 
@@ -40,6 +42,12 @@ if TYPE_CHECKING:
     from fastapi import WebSocket
 
 
+@functools.lru_cache(maxsize=128)
+def _verify_key(public_key_bytes: bytes) -> nacl.signing.VerifyKey:
+    """Build the Ed25519 verifier once per configured public key."""
+    return nacl.signing.VerifyKey(public_key_bytes)
+
+
 def normalize_event_type(event_type: str) -> str:
     """Telnyx delivers event types with either dots or underscores
     (e.g. ``streaming.started`` vs ``streaming_started``). Normalize to the
@@ -261,13 +269,17 @@ class TelnyxProvider(TelephonyProvider):
             )
             return False
 
-        try:
-            verify_key = nacl.signing.VerifyKey(public_key_bytes)
-            signed_payload = f"{timestamp}|{raw_body}".encode("utf-8")
-            verify_key.verify(signed_payload, signature_bytes)
-            return True
-        except nacl.exceptions.BadSignatureError:
-            return False
+        verify_key = _verify_key(public_key_bytes)
+        signed_payload = f"{timestamp}|{raw_body}".encode("utf-8")
+
+        def _verify() -> bool:
+            try:
+                verify_key.verify(signed_payload, signature_bytes)
+                return True
+            except nacl.exceptions.BadSignatureError:
+                return False
+
+        return await self._run_signature_check(_verify, len(signed_payload))
 
     async def get_webhook_response(
         self, workflow_id: int, organization_id: int, workflow_run_id: int
@@ -802,39 +814,39 @@ class TelnyxProvider(TelephonyProvider):
         )
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    endpoint, json=payload, headers=self._headers()
-                ) as response:
-                    response_text = await response.text()
-                    if response.status != 200:
-                        logger.error(
-                            f"Telnyx transfer dial failed: "
-                            f"status={response.status} body={response_text}"
-                        )
-                        raise Exception(
-                            f"Telnyx transfer dial failed: "
-                            f"status={response.status} body={response_text}"
-                        )
+            session = await get_http_session()
+            async with session.post(
+                endpoint, json=payload, headers=self._headers()
+            ) as response:
+                response_text = await response.text()
+                if response.status != 200:
+                    logger.error(
+                        f"Telnyx transfer dial failed: "
+                        f"status={response.status} body={response_text}"
+                    )
+                    raise Exception(
+                        f"Telnyx transfer dial failed: "
+                        f"status={response.status} body={response_text}"
+                    )
 
-                    response_data = json.loads(response_text)
-                    data = response_data.get("data", {})
-                    call_control_id = data.get("call_control_id", "")
+                response_data = json.loads(response_text)
+                data = response_data.get("data", {})
+                call_control_id = data.get("call_control_id", "")
 
-                    logger.info(
-                        f"Telnyx transfer dial initiated: "
-                        f"call_control_id={call_control_id}, "
-                        f"to={destination}, conference_name={conference_name}"
-                    )
+                logger.info(
+                    f"Telnyx transfer dial initiated: "
+                    f"call_control_id={call_control_id}, "
+                    f"to={destination}, conference_name={conference_name}"
+                )
 
-                    return {
-                        "call_sid": call_control_id,
-                        "status": "initiated",
-                        "provider": self.PROVIDER_NAME,
-                        "from_number": from_number,
-                        "to_number": destination,
-                        "raw_response": response_data,
-                    }
+                return {
+                    "call_sid": call_control_id,
+                    "status": "initiated",
+                    "provider": self.PROVIDER_NAME,
+                    "from_number": from_number,
+                    "to_number": destination,
+                    "raw_response": response_data,
+                }
         except Exception as e:
             logger.error(f"Exception during Telnyx transfer dial: {e}")
             raise
@@ -48,7 +48,7 @@ _HANGUP_CAUSE_TO_REASON = {
 async def handle_telnyx_events(
     request: Request,
     workflow_run_id: int,
-):
+) -> dict[str, str]:
     """Handle Telnyx Call Control webhook events.
 
     Telnyx sends all call lifecycle events (call.initiated, call.answered,
@@ -117,15 +117,7 @@ async def handle_telnyx_events(
     # Parse the callback data into generic format
     parsed_data = provider.parse_status_callback(event_data)
 
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        direction=parsed_data.get("direction"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
-    )
+    status_update = StatusCallbackRequest.from_parsed(parsed_data)
 
     await _process_status_update(workflow_run_id, status_update)
 
@@ -133,7 +125,9 @@ async def handle_telnyx_events(
 
 
 @router.post("/telnyx/transfer-result/{transfer_id}")
-async def handle_telnyx_transfer_result(transfer_id: str, request: Request):
+async def handle_telnyx_transfer_result(
+    transfer_id: str, request: Request
+) -> dict[str, str]:
     """Handle Telnyx Call Control events for the transfer destination leg.
 
     The destination leg is dialed by :meth:`TelnyxProvider.transfer_call` with
@@ -19,6 +19,8 @@ import aiohttp
 from loguru import logger
 from pipecat.serializers.call_strategies import HangupStrategy, TransferStrategy
 
+from api.services.telephony.call_transfer_manager import get_call_transfer_manager
+
 TELNYX_API_BASE = "https://api.telnyx.com/v2"
 
 
@@ -116,10 +118,6 @@ class TelnyxConferenceStrategy(TransferStrategy):
     async def _find_transfer_context_for_call(self, caller_call_control_id: str):
         """Find the active transfer context whose original_call_sid matches."""
         try:
-            from api.services.telephony.call_transfer_manager import (
-                get_call_transfer_manager,
-            )
-
             manager = await get_call_transfer_manager()
             return await manager.find_transfer_context_for_call(caller_call_control_id)
 
@@ -129,10 +127,6 @@ class TelnyxConferenceStrategy(TransferStrategy):
 
     async def _cleanup_transfer_context(self, transfer_id: str):
         try:
-            from api.services.telephony.call_transfer_manager import (
-                get_call_transfer_manager,
-            )
-
             manager = await get_call_transfer_manager()
             await manager.remove_transfer_context(transfer_id)
         except Exception as e:
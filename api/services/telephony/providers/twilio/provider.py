@@ -4,6 +4,7 @@ Twilio implementation of the TelephonyProvider interface.
 
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from xml.sax.saxutils import escape
 
 import aiohttp
 from fastapi import HTTPException
@@ -20,12 +21,22 @@ from api.services.telephony.base import (
     ProviderSyncResult,
     TelephonyProvider,
 )
+from api.services.telephony.http_session import get_http_session
 from api.utils.common import get_backend_endpoints
 from api.utils.telephony_address import normalize_telephony_address
 
 if TYPE_CHECKING:
     from fastapi import WebSocket
 
+# TwiML the transfer destination runs on answer; only the conference varies.
+_TRANSFER_ANSWERED_TWIML = """<?xml version="1.0" encoding="UTF-8"?>
+<Response>
+    <Say>You have answered a transfer call. Connecting you now.</Say>
+    <Dial>
+        <Conference endConferenceOnExit="true">{conference_name}</Conference>
+    </Dial>
+</Response>"""
+
 
 class TwilioProvider(TelephonyProvider):
     """
@@ -665,13 +676,7 @@ class TwilioProvider(TelephonyProvider):
         )
 
         # Inline TwiML: when the destination answers, put them into the conference
-        twiml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<Response>
-    <Say>You have answered a transfer call. Connecting you now.</Say>
-    <Dial>
-        <Conference endConferenceOnExit="true">{conference_name}</Conference>
-    </Dial>
-</Response>"""
+        twiml = _TRANSFER_ANSWERED_TWIML.format(conference_name=escape(conference_name))
 
         # Prepare Twilio API call data
         endpoint = f"{self.base_url}/Calls.json"
@@ -697,42 +702,38 @@ class TwilioProvider(TelephonyProvider):
         try:
             logger.debug(f"Transfer call data: {data}")
 
-            async with aiohttp.ClientSession() as session:
-                auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
-                async with session.post(endpoint, data=data, auth=auth) as response:
-                    response_status = response.status
-                    response_text = await response.text()
+            session = await get_http_session()
+            auth = aiohttp.BasicAuth(self.account_sid, self.auth_token)
+            async with session.post(endpoint, data=data, auth=auth) as response:
+                response_status = response.status
+                response_text = await response.text()
 
-                    logger.info(
-                        f"Twilio transfer API response status: {response_status}"
-                    )
-                    logger.debug(f"Twilio transfer API response body: {response_text}")
-
-                    if response_status in [200, 201]:
-                        try:
-                            response_data = await response.json()
-                            call_sid = response_data.get("sid")
-                            logger.info(
-                                f"Transfer call initiated successfully: {call_sid}"
-                            )
-
-                            return {
-                                "call_sid": call_sid,
-                                "status": response_data.get("status", "queued"),
-                                "provider": self.PROVIDER_NAME,
-                                "from_number": from_number,
-                                "to_number": destination,
-                                "raw_response": response_data,
-                            }
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to parse Twilio transfer response JSON: {e}"
-                            )
-                            raise Exception(f"Failed to parse transfer response: {e}")
-                    else:
-                        error_msg = f"Twilio API call failed with status {response_status}: {response_text}"
-                        logger.error(error_msg)
-                        raise Exception(error_msg)
+                logger.info(f"Twilio transfer API response status: {response_status}")
+                logger.debug(f"Twilio transfer API response body: {response_text}")
+
+                if response_status in [200, 201]:
+                    try:
+                        response_data = await response.json()
+                        call_sid = response_data.get("sid")
+                        logger.info(f"Transfer call initiated successfully: {call_sid}")
+
+                        return {
+                            "call_sid": call_sid,
+                            "status": response_data.get("status", "queued"),
+                            "provider": self.PROVIDER_NAME,
+                            "from_number": from_number,
+                            "to_number": destination,
+                            "raw_response": response_data,
+                        }
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to parse Twilio transfer response JSON: {e}"
+                        )
+                        raise Exception(f"Failed to parse transfer response: {e}")
+                else:
+                    error_msg = f"Twilio API call failed with status {response_status}: {response_text}"
+                    logger.error(error_msg)
+                    raise Exception(error_msg)
 
         except Exception as e:
             logger.error(f"Exception during Twilio transfer call: {e}")
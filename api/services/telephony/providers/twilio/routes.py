@@ -88,7 +88,7 @@ async def handle_twiml_webhook(
 async def handle_twilio_status_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Twilio-specific status callbacks."""
     set_current_run_id(workflow_run_id)
 
@@ -129,15 +129,7 @@ async def handle_twilio_status_callback(
     parsed_data = provider.parse_status_callback(callback_data)
 
     # Create StatusCallbackRequest from parsed data
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        direction=parsed_data.get("direction"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
-    )
+    status_update = StatusCallbackRequest.from_parsed(parsed_data)
 
     await _persist_amd_result_if_present(
         provider=provider,
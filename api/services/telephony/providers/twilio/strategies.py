@@ -18,6 +18,7 @@ from api.errors.failure import (
     classify_http_response,
     log_failure,
 )
+from api.services.telephony.call_transfer_manager import get_call_transfer_manager
 
 
 class TwilioConferenceStrategy(TransferStrategy):
@@ -115,10 +116,6 @@ class TwilioConferenceStrategy(TransferStrategy):
     async def _find_transfer_context_for_call(self, call_sid: str):
         """Find the active transfer context for this call."""
         try:
-            from api.services.telephony.call_transfer_manager import (
-                get_call_transfer_manager,
-            )
-
             call_transfer_manager = await get_call_transfer_manager()
             return await call_transfer_manager.find_transfer_context_for_call(call_sid)
 
@@ -129,10 +126,6 @@ class TwilioConferenceStrategy(TransferStrategy):
     async def _cleanup_transfer_context(self, transfer_id: str):
         """Clean up transfer context after completion or failure."""
         try:
-            from api.services.telephony.call_transfer_manager import (
-                get_call_transfer_manager,
-            )
-
             call_transfer_manager = await get_call_transfer_manager()
             await call_transfer_manager.remove_transfer_context(transfer_id)
         except Exception as e:
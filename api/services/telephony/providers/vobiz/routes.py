@@ -4,8 +4,10 @@ Mounted under ``/api/v1/telephony`` by ``api.routes.telephony`` via the
 provider registry — see ProviderSpec.router.
 """
 
+import asyncio
 import json
 from datetime import UTC, datetime
+from typing import Awaitable, Callable
 
 from fastapi import APIRouter, HTTPException, Request
 from loguru import logger
@@ -13,20 +15,29 @@ from pipecat.utils.run_context import set_current_run_id
 from starlette.responses import HTMLResponse
 
 from api.db import db_client
+from api.services.telephony.base import TelephonyProvider
 from api.services.telephony.factory import (
     get_telephony_provider_for_run,
 )
 from api.services.telephony.status_processor import (
     StatusCallbackRequest,
     _process_status_update,
+    handle_provider_status_callback,
 )
 from api.utils.common import get_backend_endpoints
 from api.utils.telephony_helper import (
+    generic_hangup_response,
     parse_webhook_request,
 )
 
 router = APIRouter()
 
+# Latency budgets for work done while Vobiz waits on our reply. Past these,
+# the answer webhook hangs up and signature checks fail closed rather than
+# leaving the call stalled.
+_VOBIZ_XML_WEBHOOK_TIMEOUT_SECONDS = 2.0
+_VOBIZ_SIGNATURE_TIMEOUT_SECONDS = 0.5
+
 
 async def _verify_vobiz_callback(
     provider,
@@ -44,14 +55,47 @@ async def _verify_vobiz_callback(
     missing and forged signatures. Reject with HTTP 403 (per Vobiz's
     callback-validation docs) so the caller never reaches status processing.
     """
-    is_valid = await provider.verify_inbound_signature(
-        webhook_url, callback_data, headers, raw_body
-    )
+    try:
+        async with asyncio.timeout(_VOBIZ_SIGNATURE_TIMEOUT_SECONDS):
+            is_valid = await provider.verify_inbound_signature(
+                webhook_url, callback_data, headers, raw_body
+            )
+    except TimeoutError:
+        logger.warning(f"{log_prefix} Vobiz signature verification timed out")
+        is_valid = False
     if not is_valid:
         logger.warning(f"{log_prefix} Invalid or missing Vobiz callback signature")
         raise HTTPException(status_code=403, detail="Invalid webhook signature")
 
 
+def _vobiz_signature_verifier(
+    request: Request,
+    callback_data: dict,
+    raw_body: str,
+    *,
+    callback_path: str,
+    log_prefix: str,
+) -> Callable[[TelephonyProvider], Awaitable[None]]:
+    """Build the ``verify_signature`` hook for ``handle_provider_status_callback``.
+
+    ``callback_path`` is relative to ``/api/v1/telephony``; the public URL is
+    only resolved once the run's provider is known.
+    """
+
+    async def verify(provider: TelephonyProvider) -> None:
+        backend_endpoint, _ = await get_backend_endpoints()
+        await _verify_vobiz_callback(
+            provider,
+            f"{backend_endpoint}/api/v1/telephony{callback_path}",
+            callback_data,
+            dict(request.headers),
+            raw_body,
+            log_prefix=log_prefix,
+        )
+
+    return verify
+
+
 @router.post("/vobiz-xml", include_in_schema=False)
 async def handle_vobiz_xml_webhook(
     workflow_id: int, workflow_run_id: int, organization_id: int
@@ -68,14 +112,26 @@ async def handle_vobiz_xml_webhook(
         f"workflow_id={workflow_id}, org_id={organization_id}"
     )
 
-    workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
-    provider = await get_telephony_provider_for_run(workflow_run, organization_id)
-
-    logger.debug(f"[run {workflow_run_id}] Using provider: {provider.PROVIDER_NAME}")
-
-    response_content = await provider.get_webhook_response(
-        workflow_id, organization_id, workflow_run_id
-    )
+    try:
+        async with asyncio.timeout(_VOBIZ_XML_WEBHOOK_TIMEOUT_SECONDS):
+            workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
+            provider = await get_telephony_provider_for_run(
+                workflow_run, organization_id
+            )
+
+            logger.debug(
+                f"[run {workflow_run_id}] Using provider: {provider.PROVIDER_NAME}"
+            )
+
+            response_content = await provider.get_webhook_response(
+                workflow_id, organization_id, workflow_run_id
+            )
+    except TimeoutError:
+        logger.error(
+            f"[run {workflow_run_id}] Vobiz XML webhook timed out after "
+            f"{_VOBIZ_XML_WEBHOOK_TIMEOUT_SECONDS}s, hanging up"
+        )
+        return generic_hangup_response()
 
     logger.debug(
         f"[run {workflow_run_id}] Vobiz XML response generated:\n{response_content}"
@@ -88,7 +144,7 @@ async def handle_vobiz_xml_webhook(
 async def handle_vobiz_hangup_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Vobiz hangup callback (sent when call ends).
 
     Vobiz sends callbacks to hangup_url when the call terminates.
@@ -96,8 +152,6 @@ async def handle_vobiz_hangup_callback(
     """
     set_current_run_id(workflow_run_id)
 
-    all_headers = dict(request.headers)
-
     # Parse the callback data from the raw body so signed webhooks can verify
     # the exact bytes Vobiz sent without draining the request stream first.
     callback_data, raw_body = await parse_webhook_request(request)
@@ -106,68 +160,33 @@ async def handle_vobiz_hangup_callback(
         f"[run {workflow_run_id}] Received Vobiz hangup callback {json.dumps(callback_data)}"
     )
 
-    workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
-    if not workflow_run:
-        logger.warning(
-            f"[run {workflow_run_id}] Workflow run not found for Vobiz hangup callback"
-        )
-        return {"status": "ignored", "reason": "workflow_run_not_found"}
-
-    workflow = await db_client.get_workflow_by_id(workflow_run.workflow_id)
-    if not workflow:
-        logger.warning(f"[run {workflow_run_id}] Workflow not found")
-        return {"status": "ignored", "reason": "workflow_not_found"}
-
-    provider = await get_telephony_provider_for_run(
-        workflow_run, workflow.organization_id
-    )
-
     # Fail closed: Vobiz signs every callback, so reject unsigned/forged ones
     # before they can mutate call state.
-    backend_endpoint, _ = await get_backend_endpoints()
-    webhook_url = (
-        f"{backend_endpoint}/api/v1/telephony/vobiz/hangup-callback/{workflow_run_id}"
-    )
-    await _verify_vobiz_callback(
-        provider,
-        webhook_url,
+    result = await handle_provider_status_callback(
+        workflow_run_id,
         callback_data,
-        all_headers,
-        raw_body,
-        log_prefix=f"[run {workflow_run_id}]",
-    )
-
-    logger.debug(
-        f"[run {workflow_run_id}] Processing Vobiz hangup with provider: {provider.PROVIDER_NAME}"
-    )
-
-    # Parse the callback data into generic format
-    parsed_data = provider.parse_status_callback(callback_data)
-
-    # Create StatusCallbackRequest from parsed data
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        direction=parsed_data.get("direction"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
+        verify_signature=_vobiz_signature_verifier(
+            request,
+            callback_data,
+            raw_body,
+            callback_path=f"/vobiz/hangup-callback/{workflow_run_id}",
+            log_prefix=f"[run {workflow_run_id}]",
+        ),
     )
 
-    # Process the status update
-    await _process_status_update(workflow_run_id, status_update)
-
-    logger.info(f"[run {workflow_run_id}] Vobiz hangup callback processed successfully")
+    if result["status"] == "success":
+        logger.info(
+            f"[run {workflow_run_id}] Vobiz hangup callback processed successfully"
+        )
 
-    return {"status": "success"}
+    return result
 
 
 @router.post("/vobiz/ring-callback/{workflow_run_id}")
 async def handle_vobiz_ring_callback(
     workflow_run_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Vobiz ring callback (sent when call starts ringing).
 
     Vobiz can send callbacks to ring_url when the call starts ringing.
@@ -175,8 +194,6 @@ async def handle_vobiz_ring_callback(
     """
     set_current_run_id(workflow_run_id)
 
-    all_headers = dict(request.headers)
-
     # Parse the callback data from the raw body so signed webhooks can verify
     # the exact bytes Vobiz sent without draining the request stream first.
     callback_data, raw_body = await parse_webhook_request(request)
@@ -210,13 +227,12 @@ async def handle_vobiz_ring_callback(
         provider,
         webhook_url,
         callback_data,
-        all_headers,
+        dict(request.headers),
         raw_body,
         log_prefix=f"[run {workflow_run_id}]",
     )
 
     # Log the ringing event
-    telephony_callback_logs = workflow_run.logs.get("telephony_status_callbacks", [])
     ring_log = {
         "status": "ringing",
         "timestamp": datetime.now(UTC).isoformat(),
@@ -224,12 +240,8 @@ async def handle_vobiz_ring_callback(
         "event_type": "ring",
         "raw_data": callback_data,
     }
-    telephony_callback_logs.append(ring_log)
-
-    # Update workflow run logs
-    await db_client.update_workflow_run(
-        run_id=workflow_run_id,
-        logs={"telephony_status_callbacks": telephony_callback_logs},
+    await db_client.append_workflow_run_log(
+        workflow_run_id, "telephony_status_callbacks", ring_log
     )
 
     logger.info(f"[run {workflow_run_id}] Vobiz ring callback logged")
@@ -241,11 +253,9 @@ async def handle_vobiz_ring_callback(
 async def handle_vobiz_hangup_callback_by_workflow(
     workflow_id: int,
     request: Request,
-):
+) -> dict[str, str]:
     """Handle Vobiz hangup callback with workflow_id - finds workflow run by call_id."""
 
-    all_headers = dict(request.headers)
-
     try:
         callback_data, raw_body = await parse_webhook_request(request)
     except ValueError:
@@ -263,20 +273,19 @@ async def handle_vobiz_hangup_callback_by_workflow(
         )
         return {"status": "error", "message": "No call_uuid found"}
 
-    workflow = await db_client.get_workflow_by_id(workflow_id)
-    if not workflow:
-        logger.warning(f"[workflow {workflow_id}] Workflow not found")
-        return {"status": "error", "message": "workflow_not_found"}
-
+    # The call_id lookup is scoped to workflow_id and joinedloads the
+    # workflow, so it doubles as the workflow existence check.
     try:
-        workflow_run = await db_client.get_workflow_run_by_call_id(call_uuid)
+        workflow_run = await db_client.get_workflow_run_by_call_id(
+            call_uuid, workflow_id=workflow_id
+        )
     except Exception as e:
         logger.error(
             f"[workflow {workflow_id}] Error finding workflow run for call {call_uuid}: {e}"
         )
         return {"status": "error", "message": str(e)}
 
-    if not workflow_run or workflow_run.workflow_id != workflow_id:
+    if not workflow_run:
         logger.warning(
             f"[workflow {workflow_id}] No workflow run found for call {call_uuid}"
         )
@@ -289,7 +298,7 @@ async def handle_vobiz_hangup_callback_by_workflow(
     )
 
     provider = await get_telephony_provider_for_run(
-        workflow_run, workflow.organization_id
+        workflow_run, workflow_run.workflow.organization_id
     )
 
     # Fail closed: Vobiz signs every callback, so reject unsigned/forged ones
@@ -300,25 +309,16 @@ async def handle_vobiz_hangup_callback_by_workflow(
         provider,
         webhook_url,
         callback_data,
-        all_headers,
+        dict(request.headers),
         raw_body,
         log_prefix=f"[workflow {workflow_id}]",
     )
 
     try:
         parsed_data = provider.parse_status_callback(callback_data)
+        status = StatusCallbackRequest.from_parsed(parsed_data)
 
-        status = StatusCallbackRequest(
-            call_id=parsed_data["call_id"],
-            status=parsed_data["status"],
-            from_number=parsed_data.get("from_number"),
-            to_number=parsed_data.get("to_number"),
-            direction=parsed_data.get("direction"),
-            duration=parsed_data.get("duration"),
-            extra=parsed_data.get("extra", {}),
-        )
-
-        await _process_status_update(workflow_run_id, status)
+        await _process_status_update(workflow_run_id, status, workflow_run=workflow_run)
 
         logger.info(
             f"[run {workflow_run_id}] Vobiz hangup callback processed successfully"
@@ -556,8 +556,9 @@ class VonageProvider(TelephonyProvider):
         """
         Verify Vonage signed webhook JWT and optional payload hash.
         """
-        claims = self._verify_signed_claims(headers, body)
-        return claims is not None
+        return await self._run_signature_check(
+            lambda: self._verify_signed_claims(headers, body) is not None, len(body)
+        )
 
     async def configure_inbound(
         self, address: str, webhook_url: Optional[str]
@@ -11,7 +11,9 @@ from loguru import logger
 from pipecat.utils.run_context import set_current_run_id
 
 from api.db import db_client
+from api.services.telephony.base import TelephonyProvider
 from api.services.telephony.factory import get_telephony_provider_for_run
+from api.services.telephony.status_processor import handle_provider_status_callback
 
 router = APIRouter()
 
@@ -51,7 +53,9 @@ async def _read_json_body(request: Request) -> tuple[dict, str]:
         raise HTTPException(status_code=400, detail="Webhook body is not JSON") from exc
 
 
-async def _handle_vonage_event_request(request: Request, workflow_run_id: int):
+async def _handle_vonage_event_request(
+    request: Request, workflow_run_id: int
+) -> dict[str, str]:
     set_current_run_id(workflow_run_id)
     event_data, raw_body = await _read_json_body(request)
     logger.info(
@@ -59,50 +63,23 @@ async def _handle_vonage_event_request(request: Request, workflow_run_id: int):
         f"uuid={event_data.get('uuid')} status={event_data.get('status')}"
     )
 
-    workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
-    if not workflow_run:
-        logger.error(f"[run {workflow_run_id}] Workflow run not found")
-        return {"status": "error", "message": "Workflow run not found"}
-
-    workflow = await db_client.get_workflow_by_id(workflow_run.workflow_id)
-    if not workflow:
-        logger.error(f"[run {workflow_run_id}] Workflow not found")
-        return {"status": "error", "message": "Workflow not found"}
-
-    provider = await get_telephony_provider_for_run(
-        workflow_run, workflow.organization_id
-    )
-    signature_valid = await provider.verify_inbound_signature(
-        str(request.url), event_data, dict(request.headers), raw_body
-    )
-    if not signature_valid:
-        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+    async def verify_signature(provider: TelephonyProvider) -> None:
+        signature_valid = await provider.verify_inbound_signature(
+            str(request.url), event_data, dict(request.headers), raw_body
+        )
+        if not signature_valid:
+            raise HTTPException(status_code=401, detail="Invalid webhook signature")
 
-    from api.services.telephony.status_processor import (
-        StatusCallbackRequest,
-        _process_status_update,
+    return await handle_provider_status_callback(
+        workflow_run_id, event_data, verify_signature=verify_signature
     )
 
-    parsed_data = provider.parse_status_callback(event_data)
-    status_update = StatusCallbackRequest(
-        call_id=parsed_data["call_id"],
-        status=parsed_data["status"],
-        from_number=parsed_data.get("from_number"),
-        to_number=parsed_data.get("to_number"),
-        direction=parsed_data.get("direction"),
-        duration=parsed_data.get("duration"),
-        extra=parsed_data.get("extra", {}),
-    )
-
-    await _process_status_update(workflow_run_id, status_update)
-    return {"status": "ok"}
-
 
 @router.post("/vonage/events/{workflow_run_id}")
 async def handle_vonage_events(
     request: Request,
     workflow_run_id: int,
-):
+) -> dict[str, str]:
     """Handle Vonage-specific event webhooks.
 
     Vonage sends all call events to a single endpoint.
@@ -112,7 +89,7 @@ async def handle_vonage_events(
 
 
 @router.post("/vonage/events")
-async def handle_vonage_events_without_run(request: Request):
+async def handle_vonage_events_without_run(request: Request) -> dict[str, str]:
     """Handle application-level events by resolving the run from call UUID."""
     event_data, _ = await _read_json_body(request)
     call_id = event_data.get("uuid")
@@ -6,18 +6,21 @@ introducing a circular import on the routes module.
 """
 
 from datetime import UTC, datetime
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from loguru import logger
 from pydantic import BaseModel
 
 from api.db import db_client
+from api.db.models import WorkflowRunModel
 from api.enums import TelephonyCallStatus, WorkflowRunState
 from api.services.campaign.campaign_call_dispatcher import campaign_call_dispatcher
 from api.services.campaign.campaign_event_publisher import (
     get_campaign_event_publisher,
 )
 from api.services.campaign.circuit_breaker import circuit_breaker
+from api.services.telephony.base import TelephonyProvider
+from api.services.telephony.factory import get_telephony_provider_for_run
 from api.tasks.arq import enqueue_job
 from api.tasks.function_names import FunctionNames
 
@@ -109,22 +112,41 @@ class StatusCallbackRequest(BaseModel):
 
     extra: dict = {}
 
+    @classmethod
+    def from_parsed(cls, parsed_data: Dict[str, Any]) -> "StatusCallbackRequest":
+        """Build from the dict returned by ``provider.parse_status_callback``."""
+        return cls(
+            call_id=parsed_data["call_id"],
+            status=parsed_data["status"],
+            from_number=parsed_data.get("from_number"),
+            to_number=parsed_data.get("to_number"),
+            direction=parsed_data.get("direction"),
+            duration=parsed_data.get("duration"),
+            extra=parsed_data.get("extra", {}),
+        )
+
 
-async def _process_status_update(workflow_run_id: int, status: StatusCallbackRequest):
+async def _process_status_update(
+    workflow_run_id: int,
+    status: StatusCallbackRequest,
+    workflow_run: Optional[WorkflowRunModel] = None,
+):
     """Process status updates from telephony providers.
 
     Idempotent: handles repeated callbacks (e.g. from both webhook and CDR).
+    Callers that already loaded the run pass it as ``workflow_run`` to skip
+    the re-fetch.
     """
     normalized_status = TelephonyCallStatus.from_raw(status.status)
     status_value = _status_value(status.status)
-    workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
+    if workflow_run is None:
+        workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
     if not workflow_run:
         logger.warning(
             f"[run {workflow_run_id}] Workflow run not found in status update"
         )
         return
 
-    telephony_callback_logs = workflow_run.logs.get("telephony_status_callbacks", [])
     telephony_callback_log = {
         "status": status_value,
         "timestamp": datetime.now(UTC).isoformat(),
@@ -132,11 +154,8 @@ async def _process_status_update(workflow_run_id: int, status: StatusCallbackReq
         "duration": status.duration,
         **status.extra,
     }
-    telephony_callback_logs.append(telephony_callback_log)
-
-    await db_client.update_workflow_run(
-        run_id=workflow_run_id,
-        logs={"telephony_status_callbacks": telephony_callback_logs},
+    await db_client.append_workflow_run_log(
+        workflow_run_id, "telephony_status_callbacks", telephony_callback_log
     )
 
     if normalized_status == TelephonyCallStatus.COMPLETED:
@@ -233,3 +252,52 @@ async def _process_status_update(workflow_run_id: int, status: StatusCallbackReq
         logger.warning(
             f"[run {workflow_run_id}] Unexpected status update: {status.status}"
         )
+
+
+async def handle_provider_status_callback(
+    workflow_run_id: int,
+    callback_data: Dict[str, Any],
+    *,
+    verify_signature: Optional[Callable[[TelephonyProvider], Awaitable[None]]] = None,
+) -> Dict[str, Any]:
+    """Shared body of the per-provider status-callback routes.
+
+    Resolves the run's telephony provider, lets the route verify the webhook
+    signature, then normalizes the payload and applies it. Routes stay thin
+    shells that only parse their provider-specific body format.
+
+    Args:
+        workflow_run_id: Run the callback belongs to
+        callback_data: Raw callback payload as parsed by the route
+        verify_signature: Optional provider-specific check; it must raise
+            (e.g. ``HTTPException``) to reject the callback
+
+    Returns:
+        The JSON body the route should respond with
+    """
+    workflow_run = await db_client.get_workflow_run_by_id(workflow_run_id)
+    if not workflow_run:
+        logger.warning(f"Workflow run {workflow_run_id} not found for status callback")
+        return {"status": "ignored", "reason": "workflow_run_not_found"}
+
+    # get_workflow_run_by_id joinedloads the workflow; no second lookup.
+    workflow = workflow_run.workflow
+    if not workflow:
+        logger.warning(f"Workflow {workflow_run.workflow_id} not found")
+        return {"status": "ignored", "reason": "workflow_not_found"}
+
+    provider = await get_telephony_provider_for_run(
+        workflow_run, workflow.organization_id
+    )
+
+    if verify_signature is not None:
+        await verify_signature(provider)
+
+    parsed_data = provider.parse_status_callback(callback_data)
+    await _process_status_update(
+        workflow_run_id,
+        StatusCallbackRequest.from_parsed(parsed_data),
+        workflow_run=workflow_run,
+    )
+
+    return {"status": "success"}
@@ -5,6 +5,7 @@ this task downloads the file from S3, calls MPS, then handles the embedding
 and DB writes locally.
 """
 
+import asyncio
 import os
 import tempfile
 
@@ -18,22 +19,56 @@ from api.services.storage import storage_fs
 
 MAX_FILE_SIZE_BYTES = 5 * 1024 * 1024
 EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_MAX_CONCURRENT_BATCHES = 4
 
 
 async def _embed_texts_in_batches(
     embedding_service,
     texts: list[str],
     batch_size: int = EMBEDDING_BATCH_SIZE,
+    max_concurrent_batches: int = EMBEDDING_MAX_CONCURRENT_BATCHES,
 ) -> list[list[float]]:
-    """Generate embeddings in bounded batches for provider/MPS stability."""
-    embeddings: list[list[float]] = []
-    for start in range(0, len(texts), batch_size):
-        batch = texts[start : start + batch_size]
-        logger.info(
-            f"Generating embedding batch {start // batch_size + 1} ({len(batch)} texts)"
+    """Generate embeddings in batches of at most ``batch_size`` texts.
+
+    Up to ``max_concurrent_batches`` requests are in flight at once, so a
+    large document costs a few round-trips instead of one per batch. The cap
+    keeps one document from flooding the provider or MPS; the OpenAI SDK
+    clients retry rate-limited (429) requests with backoff. If a batch fails,
+    the batches still in flight are cancelled and its error is raised.
+    Repeated texts (page headers, footers, boilerplate) are embedded once.
+    Embeddings are returned in input order, one per input text.
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+    async def embed_batch(start: int) -> list[list[float]]:
+        batch = unique_texts[start : start + batch_size]
+        async with semaphore:
+            logger.info(
+                f"Generating embedding batch {start // batch_size + 1} "
+                f"({len(batch)} texts)"
+            )
+            return await embedding_service.embed_texts(batch)
+
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(embed_batch(start))
+                for start in range(0, len(unique_texts), batch_size)
+            ]
+    except ExceptionGroup as e:
+        # Surface the batch error itself; it becomes the document's error.
+        raise e.exceptions[0]
+    embeddings = [embedding for task in tasks for embedding in task.result()]
+    if len(embeddings) != len(unique_texts):
+        raise ValueError(
+            "Embedding count mismatch: "
+            f"expected {len(unique_texts)}, got {len(embeddings)}"
         )
-        embeddings.extend(await embedding_service.embed_texts(batch))
-    return embeddings
+    if len(unique_texts) == len(texts):
+        return embeddings
+    embedding_by_text = dict(zip(unique_texts, embeddings))
+    return [embedding_by_text[text] for text in texts]
 
 
 async def process_knowledge_base_document(
@@ -94,7 +129,7 @@ async def process_knowledge_base_document(
             )
             return
 
-        file_hash = db_client.compute_file_hash(temp_file_path)
+        file_hash = await asyncio.to_thread(db_client.compute_file_hash, temp_file_path)
         mime_type = db_client.get_mime_type(temp_file_path)
 
         document = await db_client.get_document_by_id(document_id)
@@ -229,38 +264,46 @@ async def process_knowledge_base_document(
         mps_chunks = mps_response.get("chunks", [])
         if not mps_chunks:
             logger.warning(f"Document {document_id}: MPS returned zero chunks")
-
-        chunk_records = []
-        chunk_texts = []
-        for chunk in mps_chunks:
-            contextualized = chunk.get("contextualized_text") or chunk["chunk_text"]
-            chunk_records.append(
-                KnowledgeBaseChunkModel(
-                    document_id=document_id,
-                    organization_id=organization_id,
-                    chunk_text=chunk["chunk_text"],
-                    contextualized_text=contextualized,
-                    chunk_index=chunk["chunk_index"],
-                    chunk_metadata=chunk.get("chunk_metadata") or {},
-                    embedding_model=embedding_service.get_model_id(),
-                    embedding_dimension=embedding_service.get_embedding_dimension(),
-                    token_count=chunk.get("token_count", 0),
-                )
-            )
-            chunk_texts.append(contextualized)
+        # Blank chunks (e.g. empty pages) have nothing to retrieve; embedding
+        # them only costs requests and puts identical vectors in the index.
+        mps_chunks = [
+            chunk
+            for chunk in mps_chunks
+            if (chunk.get("contextualized_text") or chunk["chunk_text"]).strip()
+        ]
+
+        embedding_model = embedding_service.get_model_id()
+        embedding_dimension = embedding_service.get_embedding_dimension()
+        chunk_texts = [
+            chunk.get("contextualized_text") or chunk["chunk_text"]
+            for chunk in mps_chunks
+        ]
 
         logger.info(
             f"Generating embeddings for {len(chunk_texts)} chunks "
-            f"using {embedding_service.get_model_id()}"
+            f"using {embedding_model}"
         )
         embeddings = await _embed_texts_in_batches(embedding_service, chunk_texts)
-        if len(embeddings) != len(chunk_records):
-            raise ValueError(
-                "Embedding count mismatch: "
-                f"expected {len(chunk_records)}, got {len(embeddings)}"
+
+        # Build each row once with its embedding rather than constructing the
+        # ORM objects up front and setting the instrumented attribute again.
+        chunk_records = [
+            KnowledgeBaseChunkModel(
+                document_id=document_id,
+                organization_id=organization_id,
+                chunk_text=chunk["chunk_text"],
+                contextualized_text=contextualized,
+                chunk_index=chunk["chunk_index"],
+                chunk_metadata=chunk.get("chunk_metadata") or {},
+                embedding=embedding,
+                embedding_model=embedding_model,
+                embedding_dimension=embedding_dimension,
+                token_count=chunk.get("token_count", 0),
+            )
+            for chunk, contextualized, embedding in zip(
+                mps_chunks, chunk_texts, embeddings
             )
-        for chunk_record, embedding in zip(chunk_records, embeddings):
-            chunk_record.embedding = embedding
+        ]
 
         logger.info("Storing chunks in database")
         await db_client.replace_chunks_for_document(
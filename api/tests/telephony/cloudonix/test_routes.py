@@ -191,6 +191,22 @@ async def test_cdr_route_handles_string_session():
     assert result == {"status": "error", "message": "Missing call_id field"}
 
 
+@pytest.mark.asyncio
+async def test_cdr_route_rejects_non_object_payload():
+    """A CDR body that is valid JSON but not an object is rejected cleanly."""
+    request = _json_request(b'["acme.cloudonix.io"]')
+
+    with patch(
+        "api.services.telephony.providers.cloudonix.routes.db_client"
+    ) as db_client:
+        db_client.get_workflow_run_by_call_id = AsyncMock()
+
+        result = await handle_cloudonix_cdr(request)
+
+    assert result == {"status": "error", "message": "Invalid JSON payload"}
+    db_client.get_workflow_run_by_call_id.assert_not_awaited()
+
+
 def test_parse_cloudonix_cdr_tolerates_missing_session_and_disposition():
     """Cloudonix CDR parsing must not crash on a partial payload."""
     # Missing both session and disposition.
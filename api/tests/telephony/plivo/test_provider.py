@@ -51,8 +51,8 @@ async def test_transfer_call_dials_destination_with_answer_and_hangup_urls():
             new=AsyncMock(return_value=("https://backend.test", "wss://backend.test")),
         ),
         patch(
-            "api.services.telephony.providers.plivo.provider.aiohttp.ClientSession",
-            return_value=session,
+            "api.services.telephony.providers.plivo.provider.get_http_session",
+            new=AsyncMock(return_value=session),
         ),
     ):
         result = await provider.transfer_call(
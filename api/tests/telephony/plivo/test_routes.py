@@ -172,10 +172,9 @@ async def test_plivo_status_callback_rejects_missing_signature():
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         result = await handle_plivo_hangup_callback(
@@ -224,10 +223,9 @@ async def test_destination_answer_is_published_once_for_duplicate_callbacks():
         ),
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         first_response = await handle_plivo_transfer_xml(
@@ -287,10 +285,9 @@ async def test_original_leg_xml_does_not_publish_destination_answered():
         ),
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         response = await handle_plivo_transfer_xml(
@@ -349,10 +346,9 @@ async def _invoke_transfer_result(
         ),
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
         response = await handle_plivo_transfer_result("transfer-1", request)
 
@@ -465,10 +461,9 @@ async def test_transfer_result_rejects_invalid_signature():
         ),
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
         response = await handle_plivo_transfer_result("transfer-1", request)
 
@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import json
 import time
@@ -115,6 +116,26 @@ async def test_verify_inbound_signature_rejects_tampered_body():
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_verify_inbound_signature_offloads_large_body_to_thread():
+    body = json.dumps({"data": {"payload": {"padding": "x" * 8192}}})
+    public_key, headers = _signed_headers(body)
+    provider = _provider(public_key)
+
+    with patch(
+        "api.services.telephony.base.asyncio.to_thread", wraps=asyncio.to_thread
+    ) as to_thread:
+        result = await provider.verify_inbound_signature(
+            "https://example.test/api/v1/telephony/inbound/run",
+            json.loads(body),
+            headers,
+            body,
+        )
+
+    assert result is True
+    to_thread.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_verify_inbound_signature_rejects_missing_signature_header():
     body = _body()
@@ -201,10 +222,9 @@ async def test_telnyx_events_route_verifies_signature_before_status_update():
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         result = await handle_telnyx_events(
@@ -325,10 +345,9 @@ async def test_telnyx_events_route_rejects_invalid_signature_with_401():
         ),
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         with pytest.raises(HTTPException) as exc_info:
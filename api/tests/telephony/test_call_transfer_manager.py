@@ -7,7 +7,9 @@ These tests verify (regression for issue #328):
 3. Removing a transfer context also clears its call-sid index entry.
 """
 
+import asyncio
 from typing import Dict, List
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -27,10 +29,18 @@ class _FakeRedis:
         self._store[key] = value
 
     async def set(
-        self, key: str, value: str, *, ex: int | None = None, nx: bool = False
+        self,
+        key: str,
+        value: str,
+        *,
+        ex: int | None = None,
+        nx: bool = False,
+        xx: bool = False,
     ):
         if nx and key in self._store:
             return None
+        if xx and key not in self._store:
+            return None
         self._store[key] = value
         return True
 
@@ -122,3 +132,53 @@ async def test_claim_transfer_step_is_atomic_and_idempotent():
     assert await manager.claim_transfer_step("tx-1", "bridge_requested") is True
     assert await manager.claim_transfer_step("tx-1", "bridge_requested") is False
     assert await manager.claim_transfer_step("tx-1", "aleg_joined") is True
+
+
+@pytest.mark.asyncio
+async def test_claimed_transfer_step_replays_recorded_result():
+    from api.services.telephony.call_transfer_manager import CallTransferManager
+
+    manager = CallTransferManager(redis_client=_FakeRedis())
+
+    assert await manager.claim_transfer_step("tx-1", "result") is True
+    # Claimed but not finished yet: nothing to replay.
+    assert await manager.get_transfer_step_result("tx-1", "result") is None
+
+    await manager.record_transfer_step_result("tx-1", "result", {"status": "ok"})
+
+    assert await manager.get_transfer_step_result("tx-1", "result") == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_released_transfer_step_can_be_claimed_again():
+    from api.services.telephony.call_transfer_manager import CallTransferManager
+
+    manager = CallTransferManager(redis_client=_FakeRedis())
+
+    assert await manager.claim_transfer_step("tx-1", "result") is True
+    await manager.release_transfer_step("tx-1", "result")
+    # A result recorded after release must not resurrect the claim.
+    await manager.record_transfer_step_result("tx-1", "result", {"status": "ok"})
+
+    assert await manager.claim_transfer_step("tx-1", "result") is True
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_use_creates_a_single_redis_client():
+    from api.services.telephony.call_transfer_manager import CallTransferManager
+
+    fake = _FakeRedis()
+    manager = CallTransferManager()
+
+    async def _connect(*args, **kwargs):
+        await asyncio.sleep(0)
+        return fake
+
+    with patch(
+        "api.services.telephony.call_transfer_manager.aioredis.from_url",
+        new=AsyncMock(side_effect=_connect),
+    ) as from_url:
+        clients = await asyncio.gather(*(manager._get_redis() for _ in range(5)))
+
+    assert all(client is fake for client in clients)
+    from_url.assert_awaited_once()
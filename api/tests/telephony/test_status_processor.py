@@ -7,6 +7,7 @@ from api.enums import TelephonyCallStatus, WorkflowRunState
 from api.services.telephony.status_processor import (
     StatusCallbackRequest,
     _process_status_update,
+    handle_provider_status_callback,
 )
 from api.tasks.function_names import FunctionNames
 
@@ -19,7 +20,6 @@ async def test_initialized_no_answer_enqueues_workflow_completion():
         queued_run_id=None,
         state=WorkflowRunState.INITIALIZED.value,
         is_completed=False,
-        logs={"telephony_status_callbacks": []},
         gathered_context={"call_tags": ["existing"]},
     )
     status = StatusCallbackRequest(
@@ -38,17 +38,18 @@ async def test_initialized_no_answer_enqueues_workflow_completion():
         ) as mock_enqueue,
     ):
         mock_db.get_workflow_run_by_id = AsyncMock(return_value=workflow_run)
+        mock_db.append_workflow_run_log = AsyncMock()
         mock_db.update_workflow_run = AsyncMock()
         mock_dispatcher.release_call_slot = AsyncMock(return_value=True)
 
         await _process_status_update(123, status)
 
-    log_update = mock_db.update_workflow_run.await_args_list[0].kwargs
-    callback_log = log_update["logs"]["telephony_status_callbacks"][0]
+    run_id, log_key, callback_log = mock_db.append_workflow_run_log.await_args.args
+    assert (run_id, log_key) == (123, "telephony_status_callbacks")
     assert callback_log["status"] == "no-answer"
     assert callback_log["call_id"] == "call-123"
 
-    completion_update = mock_db.update_workflow_run.await_args_list[1].kwargs
+    completion_update = mock_db.update_workflow_run.await_args.kwargs
     assert completion_update["run_id"] == 123
     assert completion_update["is_completed"] is True
     assert completion_update["state"] == WorkflowRunState.COMPLETED.value
@@ -73,7 +74,6 @@ async def test_running_terminal_status_does_not_enqueue_workflow_completion():
         queued_run_id=None,
         state=WorkflowRunState.RUNNING.value,
         is_completed=False,
-        logs={"telephony_status_callbacks": []},
         gathered_context={"call_tags": ["not_connected"]},
     )
     status = StatusCallbackRequest(
@@ -93,12 +93,13 @@ async def test_running_terminal_status_does_not_enqueue_workflow_completion():
         ) as mock_enqueue,
     ):
         mock_db.get_workflow_run_by_id = AsyncMock(return_value=workflow_run)
+        mock_db.append_workflow_run_log = AsyncMock()
         mock_db.update_workflow_run = AsyncMock()
         mock_dispatcher.release_call_slot = AsyncMock(return_value=True)
 
         await _process_status_update(456, status)
 
-    completion_update = mock_db.update_workflow_run.await_args_list[1].kwargs
+    completion_update = mock_db.update_workflow_run.await_args.kwargs
     assert "usage_info" not in completion_update
     assert completion_update["gathered_context"]["call_tags"] == [
         "not_connected",
@@ -106,3 +107,69 @@ async def test_running_terminal_status_does_not_enqueue_workflow_completion():
     ]
     mock_enqueue.assert_not_awaited()
     mock_dispatcher.release_call_slot.assert_awaited_once_with(456)
+
+
+@pytest.mark.asyncio
+async def test_provider_status_callback_ignores_unknown_run_without_verifying():
+    verify_signature = AsyncMock()
+
+    with (
+        patch("api.services.telephony.status_processor.db_client") as mock_db,
+        patch(
+            "api.services.telephony.status_processor._process_status_update",
+            new_callable=AsyncMock,
+        ) as process_status,
+    ):
+        mock_db.get_workflow_run_by_id = AsyncMock(return_value=None)
+
+        result = await handle_provider_status_callback(
+            789, {"CallSid": "call-789"}, verify_signature=verify_signature
+        )
+
+    assert result == {"status": "ignored", "reason": "workflow_run_not_found"}
+    verify_signature.assert_not_awaited()
+    process_status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_provider_status_callback_verifies_then_processes_parsed_status():
+    provider = SimpleNamespace(
+        parse_status_callback=lambda data: {
+            "call_id": data["CallSid"],
+            "status": "completed",
+            "duration": "12",
+        }
+    )
+    verify_signature = AsyncMock()
+
+    with (
+        patch("api.services.telephony.status_processor.db_client") as mock_db,
+        patch(
+            "api.services.telephony.status_processor.get_telephony_provider_for_run",
+            new_callable=AsyncMock,
+            return_value=provider,
+        ),
+        patch(
+            "api.services.telephony.status_processor._process_status_update",
+            new_callable=AsyncMock,
+        ) as process_status,
+    ):
+        workflow_run = SimpleNamespace(
+            workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+        )
+        mock_db.get_workflow_run_by_id = AsyncMock(return_value=workflow_run)
+
+        result = await handle_provider_status_callback(
+            789, {"CallSid": "call-789"}, verify_signature=verify_signature
+        )
+
+    assert result == {"status": "success"}
+    verify_signature.assert_awaited_once_with(provider)
+    mock_db.get_workflow_run_by_id.assert_awaited_once_with(789)
+    mock_db.get_workflow_by_id.assert_not_called()
+    run_id, status = process_status.await_args.args
+    assert process_status.await_args.kwargs == {"workflow_run": workflow_run}
+    assert run_id == 789
+    assert status.call_id == "call-789"
+    assert status.duration == "12"
+    assert status.extra == {}
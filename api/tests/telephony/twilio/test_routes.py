@@ -218,10 +218,9 @@ async def test_twilio_status_callback_rejects_legacy_header_name():
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -263,10 +262,9 @@ async def test_twilio_status_callback_accepts_valid_signature():
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         result = await handle_twilio_status_callback(
@@ -312,10 +310,9 @@ async def test_twilio_status_callback_persists_answering_machine_detection_resul
         ),
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
         db_client.update_workflow_run = AsyncMock()
 
@@ -365,10 +362,9 @@ async def test_twilio_status_callback_continues_when_amd_persistence_fails():
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
         db_client.update_workflow_run = AsyncMock(side_effect=RuntimeError("db down"))
 
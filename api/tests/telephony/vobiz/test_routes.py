@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import hashlib
 import hmac
@@ -14,6 +15,7 @@ from api.services.telephony.providers.vobiz.routes import (
     handle_vobiz_hangup_callback,
     handle_vobiz_hangup_callback_by_workflow,
     handle_vobiz_ring_callback,
+    handle_vobiz_xml_webhook,
 )
 
 
@@ -135,9 +137,9 @@ async def test_vobiz_hangup_callback_accepts_signed_form_body():
     )
 
     with (
-        patch("api.services.telephony.providers.vobiz.routes.db_client") as db_client,
+        patch("api.services.telephony.status_processor.db_client") as db_client,
         patch(
-            "api.services.telephony.providers.vobiz.routes.get_telephony_provider_for_run",
+            "api.services.telephony.status_processor.get_telephony_provider_for_run",
             new_callable=AsyncMock,
             return_value=provider,
         ),
@@ -147,15 +149,14 @@ async def test_vobiz_hangup_callback_accepts_signed_form_body():
             return_value=("https://example.test", "wss://example.test"),
         ),
         patch(
-            "api.services.telephony.providers.vobiz.routes._process_status_update",
+            "api.services.telephony.status_processor._process_status_update",
             new_callable=AsyncMock,
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         result = await handle_vobiz_hangup_callback(
@@ -204,7 +205,7 @@ async def test_vobiz_ring_callback_accepts_signed_form_body():
         db_client.get_workflow_by_id = AsyncMock(
             return_value=SimpleNamespace(organization_id=11)
         )
-        db_client.update_workflow_run = AsyncMock()
+        db_client.append_workflow_run_log = AsyncMock()
 
         result = await handle_vobiz_ring_callback(
             workflow_run_id=123,
@@ -212,7 +213,10 @@ async def test_vobiz_ring_callback_accepts_signed_form_body():
         )
 
     assert result == {"status": "success"}
-    db_client.update_workflow_run.assert_awaited_once()
+    run_id, log_key, ring_log = db_client.append_workflow_run_log.await_args.args
+    assert (run_id, log_key) == (123, "telephony_status_callbacks")
+    assert ring_log["call_id"] == "call-123"
+    assert ring_log["event_type"] == "ring"
 
 
 @pytest.mark.asyncio
@@ -416,9 +420,9 @@ async def test_vobiz_hangup_callback_rejects_missing_signature():
     )
 
     with (
-        patch("api.services.telephony.providers.vobiz.routes.db_client") as db_client,
+        patch("api.services.telephony.status_processor.db_client") as db_client,
         patch(
-            "api.services.telephony.providers.vobiz.routes.get_telephony_provider_for_run",
+            "api.services.telephony.status_processor.get_telephony_provider_for_run",
             new_callable=AsyncMock,
             return_value=provider,
         ),
@@ -428,15 +432,14 @@ async def test_vobiz_hangup_callback_rejects_missing_signature():
             return_value=("https://example.test", "wss://example.test"),
         ),
         patch(
-            "api.services.telephony.providers.vobiz.routes._process_status_update",
+            "api.services.telephony.status_processor._process_status_update",
             new_callable=AsyncMock,
         ) as process_status,
     ):
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -484,7 +487,7 @@ async def test_vobiz_ring_callback_rejects_missing_signature():
         db_client.get_workflow_by_id = AsyncMock(
             return_value=SimpleNamespace(organization_id=11)
         )
-        db_client.update_workflow_run = AsyncMock()
+        db_client.append_workflow_run_log = AsyncMock()
 
         with pytest.raises(HTTPException) as exc_info:
             await handle_vobiz_ring_callback(
@@ -493,7 +496,7 @@ async def test_vobiz_ring_callback_rejects_missing_signature():
             )
 
     assert exc_info.value.status_code == 403
-    db_client.update_workflow_run.assert_not_awaited()
+    db_client.append_workflow_run_log.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -531,11 +534,12 @@ async def test_vobiz_hangup_callback_by_workflow_rejects_missing_signature():
             new_callable=AsyncMock,
         ) as process_status,
     ):
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
-        )
         db_client.get_workflow_run_by_call_id = AsyncMock(
-            return_value=SimpleNamespace(id=123, workflow_id=7)
+            return_value=SimpleNamespace(
+                id=123,
+                workflow_id=7,
+                workflow=SimpleNamespace(organization_id=11),
+            )
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -545,4 +549,40 @@ async def test_vobiz_hangup_callback_by_workflow_rejects_missing_signature():
             )
 
     assert exc_info.value.status_code == 403
+    db_client.get_workflow_run_by_call_id.assert_awaited_once_with(
+        "call-123", workflow_id=7
+    )
     process_status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_vobiz_xml_webhook_hangs_up_when_provider_response_times_out():
+    async def _stalled_response(*args):
+        await asyncio.sleep(1)
+
+    provider = SimpleNamespace(
+        PROVIDER_NAME="vobiz", get_webhook_response=_stalled_response
+    )
+
+    with (
+        patch("api.services.telephony.providers.vobiz.routes.db_client") as db_client,
+        patch(
+            "api.services.telephony.providers.vobiz.routes.get_telephony_provider_for_run",
+            new_callable=AsyncMock,
+            return_value=provider,
+        ),
+        patch(
+            "api.services.telephony.providers.vobiz.routes._VOBIZ_XML_WEBHOOK_TIMEOUT_SECONDS",
+            0.01,
+        ),
+    ):
+        db_client.get_workflow_run_by_id = AsyncMock(
+            return_value=SimpleNamespace(id=123)
+        )
+
+        response = await handle_vobiz_xml_webhook(
+            workflow_id=7, workflow_run_id=123, organization_id=11
+        )
+
+    assert response.media_type == "application/xml"
+    assert response.body == b"<Response><Hangup/></Response>"
@@ -1,6 +1,5 @@
 import hashlib
 import json
-import sys
 import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -206,34 +205,28 @@ async def test_vonage_events_route_verifies_signature_before_status_update():
     provider = _provider()
 
     with (
-        patch("api.services.telephony.providers.vonage.routes.db_client") as db_client,
+        patch("api.services.telephony.status_processor.db_client") as db_client,
         patch(
-            "api.services.telephony.providers.vonage.routes.get_telephony_provider_for_run",
+            "api.services.telephony.status_processor.get_telephony_provider_for_run",
             new_callable=AsyncMock,
             return_value=provider,
         ),
+        patch(
+            "api.services.telephony.status_processor._process_status_update",
+            new_callable=AsyncMock,
+        ) as process_status,
     ):
-        process_status = AsyncMock()
-        status_processor = SimpleNamespace(
-            StatusCallbackRequest=SimpleNamespace,
-            _process_status_update=process_status,
-        )
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
-        with patch.dict(
-            sys.modules,
-            {"api.services.telephony.status_processor": status_processor},
-        ):
-            result = await handle_vonage_events(
-                _request(body, _signed_headers(body)), workflow_run_id=123
-            )
+        result = await handle_vonage_events(
+            _request(body, _signed_headers(body)), workflow_run_id=123
+        )
 
-    assert result == {"status": "ok"}
+    assert result == {"status": "success"}
     process_status.assert_awaited_once()
 
 
@@ -243,32 +236,24 @@ async def test_vonage_events_route_rejects_invalid_signature_with_401():
     provider = _provider()
 
     with (
-        patch("api.services.telephony.providers.vonage.routes.db_client") as db_client,
+        patch("api.services.telephony.status_processor.db_client") as db_client,
         patch(
-            "api.services.telephony.providers.vonage.routes.get_telephony_provider_for_run",
+            "api.services.telephony.status_processor.get_telephony_provider_for_run",
             new_callable=AsyncMock,
             return_value=provider,
         ),
+        patch(
+            "api.services.telephony.status_processor._process_status_update",
+            new_callable=AsyncMock,
+        ) as process_status,
     ):
-        process_status = AsyncMock()
-        status_processor = SimpleNamespace(
-            StatusCallbackRequest=SimpleNamespace,
-            _process_status_update=process_status,
-        )
         db_client.get_workflow_run_by_id = AsyncMock(
-            return_value=SimpleNamespace(workflow_id=7)
-        )
-        db_client.get_workflow_by_id = AsyncMock(
-            return_value=SimpleNamespace(organization_id=11)
+            return_value=SimpleNamespace(
+                workflow_id=7, workflow=SimpleNamespace(organization_id=11)
+            )
         )
 
-        with (
-            patch.dict(
-                sys.modules,
-                {"api.services.telephony.status_processor": status_processor},
-            ),
-            pytest.raises(HTTPException) as exc_info,
-        ):
+        with pytest.raises(HTTPException) as exc_info:
             await handle_vonage_events(
                 _request(body, _signed_headers(body, signature_secret="wrong")),
                 workflow_run_id=123,
@@ -0,0 +1,112 @@
+"""
+Tests for api.services.campaign.sources.csv streaming parse and validation.
+
+Rows are parsed while the CSV downloads, so chunk boundaries can fall
+anywhere, including inside quoted fields. Parsing must still match
+``csv.reader`` over the whole file.
+"""
+
+import csv
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from api.services.campaign.sources.csv import CSVSyncService, _iter_csv_rows
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _parse(*parts):
+    return [row async for row in _iter_csv_rows(_chunks(*parts))]
+
+
+def _expected(text):
+    return list(csv.reader(StringIO(text)))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        'phone_number,name\n+1,"Doe, Jane"\n+2,"two\nlines ""quoted"""\n+3,x',
+        # A quote inside an unquoted field is literal to csv.reader, so it
+        # must not be counted as opening a quoted field.
+        'phone_number,note\n+1,5" screen\n+2,"multi\nline"\n+3,5"\n+4,"a\n\nb"\n',
+        'a,b\r\n"x\r\ny",2\r\n\r\n"q""w",3\n,\n"end"',
+    ],
+)
+async def test_iter_csv_rows_matches_csv_reader_at_every_split(text):
+    expected = _expected(text)
+    for split in range(len(text) + 1):
+        assert await _parse(text[:split], text[split:]) == expected, split
+
+
+async def test_iter_csv_rows_single_character_chunks():
+    text = 'phone_number,note\n+1,b"c\n+2,"x\ny"\n'
+    assert await _parse(*text) == _expected(text)
+
+
+async def test_iter_csv_rows_long_quoted_field_in_small_chunks():
+    text = 'phone_number,note\n+1,"' + "x\n" * 50_000 + '"\n+2,y\n'
+    parts = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+    rows = await _parse(*parts)
+
+    assert rows == _expected(text)
+    assert [row[0] for row in rows] == ["phone_number", "+1", "+2"]
+
+
+class TestCSVValidateSource:
+    async def _validate(self, rows, required_columns=None):
+        async def iter_csv_data(file_key):
+            for row in rows:
+                yield row
+
+        service = CSVSyncService()
+        with patch.object(service, "_iter_csv_data", iter_csv_data):
+            return await service.validate_source(
+                "file.csv", required_columns=required_columns
+            )
+
+    async def test_valid_source_returns_headers_without_rows(self):
+        result = await self._validate(
+            [["Phone_Number", "Name"], ["+1", "a"], ["+2", "b"]]
+        )
+
+        assert result.is_valid
+        assert result.headers == ["phone_number", "name"]
+        assert result.rows is None
+
+    async def test_requires_a_data_row(self):
+        result = await self._validate([["phone_number"]])
+
+        assert not result.is_valid
+        assert "at least one data row" in result.error.message
+
+    async def test_reports_invalid_phone_numbers(self):
+        result = await self._validate([["phone_number"], ["+1"], ["2"], ["3"]])
+
+        assert not result.is_valid
+        assert result.error.invalid_rows == [3, 4]
+
+    async def test_reports_empty_template_columns(self):
+        result = await self._validate(
+            [["phone_number", "name"], ["+1", "a"], ["+2", " "], ["+3"]],
+            required_columns={"name"},
+        )
+
+        assert not result.is_valid
+        assert "Template variable 'name' is empty in rows: 3, 4" in (
+            result.error.message
+        )
+
+    async def test_reports_missing_template_columns(self):
+        result = await self._validate(
+            [["phone_number"], ["+1"]], required_columns={"name"}
+        )
+
+        assert not result.is_valid
+        assert "missing from the source data: 'name'" in result.error.message
@@ -0,0 +1,42 @@
+"""Tests for campaign source validation error reporting."""
+
+from api.services.campaign.source_sync import (
+    _MAX_REPORTED_ROWS,
+    CampaignSourceSyncService,
+)
+
+
+def test_invalid_phone_rows_are_capped_with_total_in_message():
+    rows = [[f"{n}"] for n in range(8)]
+
+    result = CampaignSourceSyncService.validate_source_data(["phone_number"], rows)
+
+    assert not result.is_valid
+    # ``invalid_rows`` keeps only the first few rows; the message has the total.
+    assert len(result.error.invalid_rows) == _MAX_REPORTED_ROWS
+    assert result.error.invalid_rows == [2, 3, 4, 5, 6]
+    assert "Invalid phone numbers in rows: 2, 3, 4, 5, 6 and 3 more." in (
+        result.error.message
+    )
+
+
+def test_duplicate_phone_rows_are_capped_with_total_in_message():
+    rows = [["+1"]] * 9
+
+    result = CampaignSourceSyncService.validate_source_data(["phone_number"], rows)
+
+    assert not result.is_valid
+    assert len(result.error.invalid_rows) == _MAX_REPORTED_ROWS
+    assert result.error.invalid_rows == [3, 4, 5, 6, 7]
+    assert "Duplicate phone numbers found in rows: 3, 4, 5, 6, 7 and 3 more." in (
+        result.error.message
+    )
+
+
+def test_few_invalid_rows_are_all_reported():
+    rows = [["+1"], ["2"], ["+3"], ["4"]]
+
+    result = CampaignSourceSyncService.validate_source_data(["phone_number"], rows)
+
+    assert result.error.invalid_rows == [3, 5]
+    assert "Invalid phone numbers in rows: 3, 5." in result.error.message
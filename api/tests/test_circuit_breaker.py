@@ -598,6 +598,7 @@ class TestProcessStatusUpdateCircuitBreaker:
             ) as mock_get_publisher,
         ):
             mock_db.get_workflow_run_by_id = AsyncMock(return_value=mock_workflow_run)
+            mock_db.append_workflow_run_log = AsyncMock()
             mock_db.update_workflow_run = AsyncMock()
 
             mock_dispatcher.release_call_slot = AsyncMock(return_value=True)
@@ -645,6 +646,7 @@ class TestProcessStatusUpdateCircuitBreaker:
             patch("api.services.telephony.status_processor.circuit_breaker") as mock_cb,
         ):
             mock_db.get_workflow_run_by_id = AsyncMock(return_value=mock_workflow_run)
+            mock_db.append_workflow_run_log = AsyncMock()
             mock_db.update_workflow_run = AsyncMock()
 
             mock_dispatcher.release_call_slot = AsyncMock(return_value=True)
@@ -683,6 +685,7 @@ class TestProcessStatusUpdateCircuitBreaker:
             patch("api.services.telephony.status_processor.circuit_breaker") as mock_cb,
         ):
             mock_db.get_workflow_run_by_id = AsyncMock(return_value=mock_workflow_run)
+            mock_db.append_workflow_run_log = AsyncMock()
             mock_db.update_workflow_run = AsyncMock()
             mock_dispatcher.release_call_slot = AsyncMock(return_value=True)
 
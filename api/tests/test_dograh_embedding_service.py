@@ -53,6 +53,39 @@ async def test_dograh_embedding_sends_plain_without_correlation():
     assert "extra_body" not in create.await_args.kwargs
 
 
+@pytest.mark.asyncio
+async def test_embed_texts_skips_request_for_empty_batch():
+    service, create = _service_with_fake_client("corr-123")
+
+    assert await service.embed_texts([]) == []
+
+    create.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_embed_query_reuses_cached_vector_for_repeated_query():
+    service, create = _service_with_fake_client(None)
+
+    first = await service.embed_query("what are your hours?")
+    second = await service.embed_query("what are your hours?")
+
+    assert first == second == [0.1, 0.2]
+    create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_embed_query_with_correlation_always_reaches_mps():
+    service, create = _service_with_fake_client("corr-123")
+
+    await service.embed_query("where are you located?")
+    await service.embed_query("where are you located?")
+
+    # Each managed v2 query must be authorized and attributed by MPS.
+    assert create.await_count == 2
+    for call in create.await_args_list:
+        assert call.kwargs["extra_body"]["metadata"]["correlation_id"] == "corr-123"
+
+
 def _fake_mps_client(*, minted="minted"):
     return SimpleNamespace(
         create_correlation_id=AsyncMock(return_value={"correlation_id": minted}),
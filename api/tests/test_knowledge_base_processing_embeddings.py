@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from api.tasks.knowledge_base_processing import _embed_texts_in_batches
@@ -24,3 +26,69 @@ async def test_embed_texts_in_batches_preserves_order():
 
     assert service.calls == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
     assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_in_batches_bounds_concurrent_requests():
+    in_flight = 0
+    peak = 0
+
+    class SlowEmbeddingService:
+        async def embed_texts(self, texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Finish later batches first to check results keep input order.
+            await asyncio.sleep(0.01 / len(texts[0]))
+            in_flight -= 1
+            return [[float(len(text))] for text in texts]
+
+    embeddings = await _embed_texts_in_batches(
+        SlowEmbeddingService(),
+        ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"],
+        batch_size=1,
+        max_concurrent_batches=2,
+    )
+
+    assert peak == 2
+    assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0], [6.0]]
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_in_batches_embeds_repeated_texts_once():
+    service = FakeEmbeddingService()
+
+    embeddings = await _embed_texts_in_batches(
+        service,
+        ["header", "a", "header", "bb", "a"],
+        batch_size=2,
+    )
+
+    assert service.calls == [["header", "a"], ["bb"]]
+    assert embeddings == [[6.0], [1.0], [6.0], [2.0], [1.0]]
+
+
+@pytest.mark.asyncio
+async def test_embed_texts_in_batches_cancels_in_flight_batches_on_failure():
+    cancelled = []
+
+    class FailingEmbeddingService:
+        async def embed_texts(self, texts):
+            if texts == ["bad"]:
+                raise RuntimeError("provider error")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.extend(texts)
+                raise
+            return [[0.0] for _ in texts]
+
+    with pytest.raises(RuntimeError, match="provider error"):
+        await _embed_texts_in_batches(
+            FailingEmbeddingService(),
+            ["a", "bad", "c"],
+            batch_size=1,
+            max_concurrent_batches=3,
+        )
+
+    assert sorted(cancelled) == ["a", "c"]
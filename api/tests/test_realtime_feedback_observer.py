@@ -4,6 +4,7 @@ from types import SimpleNamespace
 import pytest
 from pipecat.frames.frames import (
     ErrorFrame,
+    OutputAudioRawFrame,
     TranscriptionFrame,
     TTSTextFrame,
 )
@@ -12,6 +13,7 @@ from pipecat.processors.frame_processor import FrameDirection
 from pipecat.transports.base_output import BaseOutputTransport
 from pipecat.transports.base_transport import TransportParams
 
+from api.services.pipecat import realtime_feedback_observer as observer_module
 from api.services.pipecat.in_memory_buffers import InMemoryLogsBuffer
 from api.services.pipecat.realtime_feedback_observer import (
     RealtimeFeedbackObserver,
@@ -122,6 +124,42 @@ async def test_observer_waits_for_tts_text_from_output_transport():
     ]
 
 
+@pytest.mark.asyncio
+async def test_observer_remembers_only_recent_frame_ids(monkeypatch):
+    messages = []
+
+    async def ws_sender(message):
+        messages.append(message)
+
+    monkeypatch.setattr(observer_module, "_MAX_FRAMES_SEEN", 2)
+    observer = RealtimeFeedbackObserver(ws_sender=ws_sender)
+    frames = [TranscriptionFrame(f"turn {i}", "user-1", "ts") for i in range(3)]
+
+    for frame in frames:
+        await observer.on_push_frame(_frame_pushed(frame, FrameDirection.DOWNSTREAM))
+    # Re-observing a remembered frame is still deduplicated.
+    await observer.on_push_frame(_frame_pushed(frames[2], FrameDirection.DOWNSTREAM))
+
+    assert len(messages) == 3
+    assert list(observer._frames_seen) == [frames[1].id, frames[2].id]
+
+
+@pytest.mark.asyncio
+async def test_observer_skips_unhandled_frames_without_remembering_them():
+    messages = []
+
+    async def ws_sender(message):
+        messages.append(message)
+
+    observer = RealtimeFeedbackObserver(ws_sender=ws_sender)
+    frame = OutputAudioRawFrame(audio=b"\x00\x00", sample_rate=16000, num_channels=1)
+
+    await observer.on_push_frame(_frame_pushed(frame, FrameDirection.DOWNSTREAM))
+
+    assert messages == []
+    assert frame.id not in observer._frames_seen
+
+
 @pytest.mark.asyncio
 async def test_observer_classifies_each_distinct_error_frame(monkeypatch):
     messages = []
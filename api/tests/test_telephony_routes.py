@@ -441,6 +441,26 @@ async def test_inbound_run_rejects_when_concurrency_limit_reached():
     mock_db.create_workflow_run.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_inbound_run_hangs_up_outbound_webhook_before_provider_detection():
+    request = SimpleNamespace(headers={}, url="https://api.example.com/inbound/run")
+    webhook_data = {"CallSid": "CA123", "Direction": "outbound-api"}
+
+    with (
+        patch(
+            "api.routes.telephony.parse_webhook_request",
+            new=AsyncMock(return_value=(webhook_data, "raw-body")),
+        ),
+        patch(
+            "api.routes.telephony._detect_provider", new_callable=AsyncMock
+        ) as detect_provider,
+    ):
+        response = await handle_inbound_run(request)
+
+    assert b"<Hangup/>" in response.body
+    detect_provider.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_smallwebrtc_run_reaching_telephony_websocket_closes_without_running():
     websocket = AsyncMock()
@@ -482,3 +502,125 @@ async def test_smallwebrtc_run_reaching_telephony_websocket_closes_without_runni
     assert mock_db.update_workflow_run.await_count == 0
     assert provider_lookup.await_count == 0
     mock_concurrency.unregister_active_call.assert_not_awaited()
+
+
+def test_transfer_result_intermediate_status_skips_transfer_context_lookup():
+    client = TestClient(_make_test_app())
+    manager = SimpleNamespace(
+        get_transfer_context=AsyncMock(),
+        publish_transfer_event=AsyncMock(),
+    )
+
+    with patch(
+        "api.routes.telephony.get_call_transfer_manager",
+        new=AsyncMock(return_value=manager),
+    ):
+        response = client.post(
+            "/telephony/transfer-result/transfer-1",
+            data={"CallStatus": "ringing", "CallSid": "CA-transfer"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "pending"}
+    manager.get_transfer_context.assert_not_awaited()
+    manager.publish_transfer_event.assert_not_awaited()
+
+
+def _transfer_result_manager(**overrides):
+    manager = SimpleNamespace(
+        claim_transfer_step=AsyncMock(return_value=True),
+        get_transfer_step_result=AsyncMock(return_value=None),
+        record_transfer_step_result=AsyncMock(),
+        release_transfer_step=AsyncMock(),
+        get_transfer_context=AsyncMock(
+            return_value=SimpleNamespace(
+                original_call_sid="CA-original", conference_name="conf-1"
+            )
+        ),
+        publish_transfer_event=AsyncMock(return_value=True),
+    )
+    for name, value in overrides.items():
+        setattr(manager, name, value)
+    return manager
+
+
+def test_transfer_result_retry_does_not_republish_event():
+    client = TestClient(_make_test_app())
+    recorded = {}
+
+    async def record(transfer_id, step, result, ttl):
+        recorded[step] = result
+
+    async def previous(transfer_id, step):
+        return recorded.get(step)
+
+    manager = _transfer_result_manager(
+        claim_transfer_step=AsyncMock(side_effect=[True, False]),
+        record_transfer_step_result=AsyncMock(side_effect=record),
+        get_transfer_step_result=AsyncMock(side_effect=previous),
+    )
+    form = {"CallStatus": "in-progress", "CallSid": "CA-transfer"}
+
+    with patch(
+        "api.routes.telephony.get_call_transfer_manager",
+        new=AsyncMock(return_value=manager),
+    ):
+        first = client.post("/telephony/transfer-result/transfer-1", data=form)
+        retry = client.post("/telephony/transfer-result/transfer-1", data=form)
+
+    assert first.json()["status"] == "completed"
+    # The retry replays the first response, context-derived fields included.
+    assert retry.json() == first.json()
+    assert retry.json()["result"]["conference_id"] == "conf-1"
+    assert retry.json()["result"]["original_call_sid"] == "CA-original"
+    manager.claim_transfer_step.assert_awaited_with(
+        "transfer-1", "result:CA-transfer:in-progress", ttl=600
+    )
+    manager.get_transfer_context.assert_awaited_once_with("transfer-1")
+    manager.publish_transfer_event.assert_awaited_once()
+
+
+def test_transfer_result_releases_claim_when_handling_fails():
+    client = TestClient(_make_test_app(), raise_server_exceptions=False)
+    manager = _transfer_result_manager(
+        get_transfer_context=AsyncMock(side_effect=RuntimeError("redis down")),
+    )
+
+    with patch(
+        "api.routes.telephony.get_call_transfer_manager",
+        new=AsyncMock(return_value=manager),
+    ):
+        response = client.post(
+            "/telephony/transfer-result/transfer-1",
+            data={"CallStatus": "busy", "CallSid": "CA-transfer"},
+        )
+
+    # A 5xx makes Twilio retry, and the released claim lets the retry publish.
+    assert response.status_code == 500
+    manager.release_transfer_step.assert_awaited_once_with(
+        "transfer-1", "result:CA-transfer:busy"
+    )
+    manager.record_transfer_step_result.assert_not_awaited()
+    manager.publish_transfer_event.assert_not_awaited()
+
+
+def test_transfer_result_publish_failure_releases_claim_for_retry():
+    client = TestClient(_make_test_app())
+    manager = _transfer_result_manager(
+        publish_transfer_event=AsyncMock(return_value=False),
+    )
+
+    with patch(
+        "api.routes.telephony.get_call_transfer_manager",
+        new=AsyncMock(return_value=manager),
+    ):
+        response = client.post(
+            "/telephony/transfer-result/transfer-1",
+            data={"CallStatus": "in-progress", "CallSid": "CA-transfer"},
+        )
+
+    assert response.status_code == 503
+    manager.release_transfer_step.assert_awaited_once_with(
+        "transfer-1", "result:CA-transfer:in-progress"
+    )
+    manager.record_transfer_step_result.assert_not_awaited()
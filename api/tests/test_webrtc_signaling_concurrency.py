@@ -167,3 +167,44 @@ async def test_signaling_websocket_accepts_matching_workflow_and_run():
         await signaling_websocket(ws, workflow_id=33, workflow_run_id=501, user=user)
 
     mock_manager.handle_websocket.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_offer_rejected_when_process_pipeline_cap_reached():
+    manager = SignalingManager()
+    manager._pipeline_tasks = {SimpleNamespace()}
+    ws = _FakeWebSocket()
+    authorize = AsyncMock()
+
+    with (
+        patch("api.routes.webrtc_signaling.MAX_CONCURRENT_WEBRTC_PIPELINES", 1),
+        patch(
+            "api.routes.webrtc_signaling.authorize_workflow_run_start",
+            new=authorize,
+        ),
+        patch.object(
+            manager, "_close_websocket_if_connected", new=AsyncMock()
+        ) as close_ws,
+    ):
+        await manager._handle_offer(
+            ws,
+            _offer_payload(),
+            workflow_id=33,
+            workflow_run_id=501,
+            user=SimpleNamespace(id=7),
+            organization_id=11,
+            connection_key="conn-1",
+            enforce_call_concurrency=False,
+        )
+
+    ws.send_json.assert_awaited_once_with(
+        {
+            "type": "error",
+            "payload": {
+                "error_type": "server_busy",
+                "message": "Server busy, please try again shortly",
+            },
+        }
+    )
+    close_ws.assert_awaited_once_with(ws, code=1013, reason="server busy")
+    authorize.assert_not_awaited()
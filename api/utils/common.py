@@ -11,6 +11,17 @@ from loguru import logger
 from api.constants import BACKEND_API_ENDPOINT
 from api.utils.tunnel import TunnelURLProvider
 
+# get_backend_endpoints() re-validates BACKEND_API_ENDPOINT on every webhook,
+# so compile the URL checks once at import.
+_SINGLE_SLASH_SCHEME_RE = re.compile(r"^https?:/[^/]")
+_MISSING_COLON_SCHEME_RE = re.compile(r"^https?//[^/]")
+_MISSING_SLASHES_SCHEME_RE = re.compile(r"^https?:[^/]")
+_WHITESPACE_RE = re.compile(r"\s")
+_TRAILING_PORT_RE = re.compile(r":([^/]*)$")
+
+# Carrier-grade NAT (RFC 6598) range, see is_local_or_private_url().
+_CGNAT_NETWORK = ipaddress.ip_network("100.64.0.0/10")
+
 
 def get_scheme(url: str) -> str | None:
     """
@@ -55,9 +66,7 @@ def is_local_or_private_url(url: str) -> bool:
         return True
     # Carrier-grade NAT (RFC 6598) — behind NAT, not publicly reachable. Kept in
     # sync with scripts/lib/setup_common.sh:dograh_is_local_ipv4.
-    return isinstance(ip, ipaddress.IPv4Address) and ip in ipaddress.ip_network(
-        "100.64.0.0/10"
-    )
+    return isinstance(ip, ipaddress.IPv4Address) and ip in _CGNAT_NETWORK
 
 
 def _validate_url(url: str) -> None:
@@ -79,11 +88,11 @@ def _validate_url(url: str) -> None:
         )
 
     # Check for malformed schemes (single slash like http:/localhost)
-    if re.match(r"^https?:/[^/]", url):
+    if _SINGLE_SLASH_SCHEME_RE.match(url):
         raise ValueError(f"Invalid BACKEND_API_ENDPOINT: malformed scheme in '{url}'")
 
     # Check for malformed scheme separators (http// or http:xyz without //)
-    if re.match(r"^https?//[^/]", url) or re.match(r"^https?:[^/]", url):
+    if _MISSING_COLON_SCHEME_RE.match(url) or _MISSING_SLASHES_SCHEME_RE.match(url):
         raise ValueError(
             f"Invalid BACKEND_API_ENDPOINT: malformed scheme separator in '{url}'"
         )
@@ -110,13 +119,13 @@ def _validate_url(url: str) -> None:
         raise ValueError(f"Invalid BACKEND_API_ENDPOINT: missing host in '{url}'")
 
     # Check for invalid characters in hostname (whitespace)
-    if re.search(r"\s", host_part):
+    if _WHITESPACE_RE.search(host_part):
         raise ValueError(
             f"Invalid BACKEND_API_ENDPOINT: invalid characters in hostname '{url}'"
         )
 
     # Check for invalid port - look for colon followed by anything
-    port_match = re.search(r":([^/]*)$", host_part)
+    port_match = _TRAILING_PORT_RE.search(host_part)
     if port_match:
         port_str = port_match.group(1)
         if not port_str:
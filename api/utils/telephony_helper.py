@@ -129,6 +129,25 @@ def normalize_webhook_data(provider_class, webhook_data, headers=None):
     return parse_method(webhook_data)
 
 
+def is_outbound_webhook(webhook_data: dict) -> bool:
+    """Cheap pre-detection check for webhooks that are plainly not inbound.
+
+    Reads only the raw direction field providers send (``Direction`` for
+    Twilio/Plivo/Vobiz/Cloudonix, ``direction`` for Vonage and inside the
+    Telnyx event payload), so misrouted outbound callbacks can be hung up
+    before provider detection and normalization. Anything ambiguous returns
+    False; the normalized direction check stays authoritative.
+    """
+    direction = webhook_data.get("Direction") or webhook_data.get("direction")
+    if direction is None:
+        event = webhook_data.get("data")
+        if isinstance(event, dict) and isinstance(event.get("payload"), dict):
+            direction = event["payload"].get("direction")
+    return isinstance(direction, str) and direction.lower().startswith(
+        ("outbound", "outgoing")
+    )
+
+
 def generic_hangup_response():
     """Return a generic hangup response for unknown/error cases"""
     return HTMLResponse(
@@ -303,6 +303,7 @@ for ((w = 0; w < FASTAPI_WORKERS; w++)); do
     cd "$BASE_DIR"
     export LOG_FILE_PATH="$LOG_DIR/${name}.log"
     exec uvicorn api.app:app --host 127.0.0.1 --port "$port" \
+      --loop uvloop --http httptools \
       >>"$LOG_DIR/${name}.log" 2>&1
   ) &
 
@@ -109,7 +109,7 @@ SERVICE_COMMANDS=(
 for ((w=0; w<FASTAPI_WORKERS; w++)); do
   port=$((UVICORN_BASE_PORT + w))
   SERVICE_NAMES+=("uvicorn_$port")
-  SERVICE_COMMANDS+=("uvicorn api.app:app --host 127.0.0.1 --port $port")
+  SERVICE_COMMANDS+=("uvicorn api.app:app --host 127.0.0.1 --port $port --loop uvloop --http httptools")
 done
 
 # Add ARQ workers dynamically